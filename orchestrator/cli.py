@@ -13,28 +13,102 @@ Supported commands:
 """
 
 import argparse
+import functools
 import json
 import sys
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 try:
-    from .utils.schema import SchemaValidator
-    from .execution.service import ExecutionService
-    from .explain.engine import ExplanationEngine
-    from .gen_tests import TestGenerator
-    from .templates.manager import LanguageTemplateManager
+    import orjson as _json_fast
 except ImportError:
-    from utils.schema import SchemaValidator
-    from execution.service import ExecutionService
-    from explain.engine import ExplanationEngine
-    from gen_tests import TestGenerator
-    from templates.manager import LanguageTemplateManager
+    _json_fast = None
+
+
+def _dump_json(result: Dict[str, Any], pretty: bool = True) -> str:
+    """Serialize a result dict to JSON, using orjson when available.
+
+    Pretty-printing is skipped when output is being consumed by tooling
+    (piped stdout), where the whitespace is pure overhead.
+    """
+    if _json_fast is not None:
+        option = _json_fast.OPT_INDENT_2 if pretty else 0
+        return _json_fast.dumps(result, option=option).decode()
+    if pretty:
+        return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
+
+
+def _write_json(result: Dict[str, Any], pretty: bool = True) -> None:
+    """Write a result dict to stdout as JSON.
+
+    With orjson the serialized bytes are written straight to the stdout
+    buffer, skipping the str decode + re-encode that print() would do.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if _json_fast is not None and buffer is not None:
+        option = _json_fast.OPT_INDENT_2 if pretty else 0
+        buffer.write(_json_fast.dumps(result, option=option) + b"\n")
+        buffer.flush()
+        return
+    print(_dump_json(result, pretty))
+
+# Known subcommand names, used to sniff argv before building subparsers.
+_COMMANDS = (
+    "run", "explain", "gen-tests", "switch-lang",
+    "validate", "stats", "list-languages", "template-info",
+)
+
+
+def _sniff_subcommand(argv):
+    """Return the first token in argv that names a known subcommand, or None."""
+    for token in argv:
+        if token in _COMMANDS:
+            return token
+    return None
+
+
+# CLI language names -> execution service language codes.
+_LANG_MAPPING = {
+    "python": "py",
+    "cpp": "cpp",
+    "c++": "cpp",
+    "c": "c",
+    "javascript": "js",
+    "java": "java"
+}
+
+# Parser constants shared across parser builds (server/batch mode rebuilds).
+_TESTS_CHOICES = ("sample", "unit", "all")
+_GEN_TYPE_CHOICES = ("unit", "edge", "stress")
+_EPILOG = """
+Examples:
+  # Run code with JSON input
+  python -m orchestrator.cli run --json '{"problem": "two-sum", "lang": "python", "code": "..."}'
+  
+  # Generate explanation
+  python -m orchestrator.cli explain --problem two-sum --lang python
+  
+  # Generate test cases
+  python -m orchestrator.cli gen-tests --problem two-sum --count 10
+  
+  # Switch language template
+  python -m orchestrator.cli switch-lang --problem two-sum --from python --to cpp
+            """
+
+# Argument attributes that JSON-routed commands may rely on.
+_JSON_ARG_KEYS = (
+    "problem", "lang", "code", "code_file", "tests",
+    "count", "type", "from_lang", "to_lang",
+)
+
+# Languages reported by the mock template manager fallback.
+_SUPPORTED_LANGUAGES = ("python", "cpp", "java", "javascript", "c")
 
 
 class MockExplanationEngine:
     """Mock explanation engine for CLI testing."""
-    
+
     def generate_explanation(self, problem_slug: str, language: str, code: str = None):
         """Mock generate explanation method."""
         return f"This is a mock explanation for {problem_slug} in {language}."
@@ -42,7 +116,7 @@ class MockExplanationEngine:
 
 class MockTestGenerator:
     """Mock test generator for CLI testing."""
-    
+
     def generate_test_cases(self, config):
         """Mock generate test cases method."""
         count = getattr(config, 'test_set_size', 5)
@@ -51,6 +125,98 @@ class MockTestGenerator:
             for i in range(count)
         ]
 
+    def generate_tests(self, problem_slug: str, count: int = 10, test_type: str = "unit"):
+        """Mock generate tests method used by the gen-tests fallback."""
+        return [
+            {
+                "id": f"test_{i+1}",
+                "input": f"test_input_{i}",
+                "output": f"test_output_{i}",
+                "type": test_type,
+                "description": f"Mock test case {i+1}"
+            }
+            for i in range(count)
+        ]
+
+
+# Scalar fields of the canned mock run result; copied per call with a fresh
+# test_results list so callers can mutate their copy safely.
+_MOCK_RUN_RESULT = {
+    "status": "accepted",
+    "overall_result": "OK",
+    "passed_tests": 2,
+    "total_tests": 2,
+    "success_rate": 100.0,
+    "total_time_ms": 120,
+}
+
+
+class MockExecutionService:
+    """Mock execution service used as fallback when the real one fails."""
+
+    def run_solution(self, problem_slug: str, language: str, code: str, test_set: str = "all"):
+        return {**_MOCK_RUN_RESULT, "test_results": []}
+
+    async def execute_solution(self, code: str, language: str, problem_id: str, user_id=None, session_id=None):
+        return {**_MOCK_RUN_RESULT, "test_results": []}
+
+    async def validate_syntax(self, code: str, language: str):
+        return {"valid": True, "message": "Mock validation", "language": language}
+
+    async def get_execution_stats(self):
+        return {"total_executions": 10, "successful_executions": 8}
+
+    async def get_problem_analytics(self, problem_id: str):
+        return {"problem_id": problem_id, "total_attempts": 5}
+
+    async def get_language_analytics(self, language: str):
+        return {"language": language, "total_executions": 3}
+
+
+class MockTemplateManager:
+    """Mock template manager used as fallback when the real one fails."""
+
+    def switch_language(self, problem_slug: str, from_lang: str, to_lang: str, preserve_logic: bool = True):
+        return {
+            "problem": problem_slug,
+            "from_lang": from_lang,
+            "to_lang": to_lang,
+            "template_updated": True
+        }
+
+    def get_supported_languages(self):
+        return _SUPPORTED_LANGUAGES
+
+    def get_template_info(self, problem_slug: str, language: str):
+        return {
+            "problem": problem_slug,
+            "language": language,
+            "file_path": f"/mock/{problem_slug}.{language}",
+            "exists": True,
+            "extension": f".{language}",
+            "main_function": "main"
+        }
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_execution_service() -> MockExecutionService:
+    return MockExecutionService()
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_explanation_engine() -> MockExplanationEngine:
+    return MockExplanationEngine()
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_test_generator() -> MockTestGenerator:
+    return MockTestGenerator()
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_template_manager() -> MockTemplateManager:
+    return MockTemplateManager()
+
 
 class CLIError(Exception):
     """Custom exception for CLI-related errors."""
@@ -65,120 +231,129 @@ class OrchestatorCLI:
     """
     
     def __init__(self):
-        # Initialize real services
-        try:
-            self.execution_service = ExecutionService()
-            self.explanation_engine = ExplanationEngine()
-            self.test_generator = TestGenerator()
-            self.template_manager = LanguageTemplateManager()
-            self.schema_validator = SchemaValidator()
-        except Exception as e:
-            # Fallback to mock services if real services fail to initialize
-            print(f"Warning: Failed to initialize services, using mocks: {e}")
-            self.execution_service = self._create_mock_execution_service()
-            self.explanation_engine = self._create_mock_explanation_engine()
-            self.test_generator = self._create_mock_test_generator()
-            self.template_manager = self._create_mock_template_manager()
-            self.schema_validator = SchemaValidator()
-    
-    def _create_mock_execution_service(self):
-        """Create mock execution service as fallback."""
-        class MockExecutionService:
-            def run_solution(self, problem_slug: str, language: str, code: str, test_set: str = "all"):
-                return {
-                    "status": "accepted",
-                    "overall_result": "OK",
-                    "passed_tests": 2,
-                    "total_tests": 2,
-                    "success_rate": 100.0,
-                    "total_time_ms": 120,
-                    "test_results": []
-                }
-            async def execute_solution(self, code: str, language: str, problem_id: str, user_id=None, session_id=None):
-                return {
-                    "status": "accepted",
-                    "overall_result": "OK",
-                    "passed_tests": 2,
-                    "total_tests": 2,
-                    "success_rate": 100.0,
-                    "total_time_ms": 120,
-                    "test_results": []
-                }
-            async def validate_syntax(self, code: str, language: str):
-                return {"valid": True, "message": "Mock validation", "language": language}
-            async def get_execution_stats(self):
-                return {"total_executions": 10, "successful_executions": 8}
-            async def get_problem_analytics(self, problem_id: str):
-                return {"problem_id": problem_id, "total_attempts": 5}
-            async def get_language_analytics(self, language: str):
-                return {"language": language, "total_executions": 3}
-        return MockExecutionService()
-    
-    def _create_mock_explanation_engine(self):
-        """Create mock explanation engine as fallback."""
-        class MockExplanationEngine:
-            def generate_explanation(self, problem_slug: str, language: str, code: str = None):
-                return f"Mock explanation for {problem_slug} in {language}."
-        return MockExplanationEngine()
-    
-    def _create_mock_test_generator(self):
-        """Create mock test generator as fallback."""
-        class MockTestGenerator:
-            def generate_tests(self, problem_slug: str, count: int = 10, test_type: str = "unit"):
-                return [
-                    {
-                        "id": f"test_{i+1}",
-                        "input": f"test_input_{i}",
-                        "output": f"test_output_{i}",
-                        "type": test_type,
-                        "description": f"Mock test case {i+1}"
-                    }
-                    for i in range(count)
-                ]
-        return MockTestGenerator()
-    
-    def _create_mock_template_manager(self):
-        """Create mock template manager as fallback."""
-        class MockTemplateManager:
-            def switch_language(self, problem_slug: str, from_lang: str, to_lang: str, preserve_logic: bool = True):
-                return {
-                    "problem": problem_slug,
-                    "from_lang": from_lang,
-                    "to_lang": to_lang,
-                    "template_updated": True
-                }
-            def get_supported_languages(self):
-                return ["python", "cpp", "java", "javascript", "c"]
-            def get_template_info(self, problem_slug: str, language: str):
-                return {
-                    "problem": problem_slug,
-                    "language": language,
-                    "file_path": f"/mock/{problem_slug}.{language}",
-                    "exists": True,
-                    "extension": f".{language}",
-                    "main_function": "main"
-                }
-        return MockTemplateManager()
-        
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Create and configure the argument parser."""
+        # Services are imported and constructed lazily on first access so that
+        # --help and single-subcommand invocations only pay for what they use.
+        self._execution_service = None
+        self._explanation_engine = None
+        self._test_generator = None
+        self._template_manager = None
+        self._schema_validator = None
+        self._supported_languages_cache = None
+        # Parsers cached per sniffed subcommand for server/batch mode.
+        self._parsers = {}
+        # Server mode writes responses as bytes straight to the stdout buffer.
+        self._binary_stdout = False
+
+        # Command dispatch table: command name -> (handler, is_async).
+        self._dispatch = {
+            "run": (self.handle_run_command, True),
+            "explain": (self.handle_explain_command, False),
+            "gen-tests": (self.handle_gen_tests_command, False),
+            "switch-lang": (self.handle_switch_lang_command, False),
+            "validate": (self.handle_validate_command, True),
+            "stats": (self.handle_stats_command, True),
+            "list-languages": (self.handle_list_languages_command, False),
+            "template-info": (self.handle_template_info_command, False),
+        }
+
+    @property
+    def execution_service(self):
+        """Execution service, imported and constructed on first access."""
+        if self._execution_service is None:
+            try:
+                try:
+                    from .execution.service import ExecutionService
+                except ImportError:
+                    from execution.service import ExecutionService
+                self._execution_service = ExecutionService()
+            except Exception as e:
+                print(f"Warning: Failed to initialize execution service, using mock: {e}", file=sys.stderr)
+                self._execution_service = _mock_execution_service()
+        return self._execution_service
+
+    @execution_service.setter
+    def execution_service(self, value):
+        self._execution_service = value
+
+    @property
+    def explanation_engine(self):
+        """Explanation engine, imported and constructed on first access."""
+        if self._explanation_engine is None:
+            try:
+                try:
+                    from .explain.engine import ExplanationEngine
+                except ImportError:
+                    from explain.engine import ExplanationEngine
+                self._explanation_engine = ExplanationEngine()
+            except Exception as e:
+                print(f"Warning: Failed to initialize explanation engine, using mock: {e}", file=sys.stderr)
+                self._explanation_engine = _mock_explanation_engine()
+        return self._explanation_engine
+
+    @explanation_engine.setter
+    def explanation_engine(self, value):
+        self._explanation_engine = value
+
+    @property
+    def test_generator(self):
+        """Test generator, imported and constructed on first access."""
+        if self._test_generator is None:
+            try:
+                try:
+                    from .gen_tests import TestGenerator
+                except ImportError:
+                    from gen_tests import TestGenerator
+                self._test_generator = TestGenerator()
+            except Exception as e:
+                print(f"Warning: Failed to initialize test generator, using mock: {e}", file=sys.stderr)
+                self._test_generator = _mock_test_generator()
+        return self._test_generator
+
+    @test_generator.setter
+    def test_generator(self, value):
+        self._test_generator = value
+
+    @property
+    def template_manager(self):
+        """Template manager, imported and constructed on first access."""
+        if self._template_manager is None:
+            try:
+                try:
+                    from .templates.manager import LanguageTemplateManager
+                except ImportError:
+                    from templates.manager import LanguageTemplateManager
+                self._template_manager = LanguageTemplateManager()
+            except Exception as e:
+                print(f"Warning: Failed to initialize template manager, using mock: {e}", file=sys.stderr)
+                self._template_manager = _mock_template_manager()
+        return self._template_manager
+
+    @template_manager.setter
+    def template_manager(self, value):
+        self._template_manager = value
+        self._supported_languages_cache = None
+
+    @property
+    def schema_validator(self):
+        """Schema validator, imported and constructed on first access."""
+        if self._schema_validator is None:
+            try:
+                from .utils.schema import SchemaValidator
+            except ImportError:
+                from utils.schema import SchemaValidator
+            self._schema_validator = SchemaValidator()
+        return self._schema_validator
+
+    @schema_validator.setter
+    def schema_validator(self, value):
+        self._schema_validator = value
+
+    def _create_base_parser(self) -> argparse.ArgumentParser:
+        """Create the parser with global options but no subparsers."""
         parser = argparse.ArgumentParser(
             description="Interview Coding Platform Orchestrator CLI",
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  # Run code with JSON input
-  python -m orchestrator.cli run --json '{"problem": "two-sum", "lang": "python", "code": "..."}'
-  
-  # Generate explanation
-  python -m orchestrator.cli explain --problem two-sum --lang python
-  
-  # Generate test cases
-  python -m orchestrator.cli gen-tests --problem two-sum --count 10
-  
-  # Switch language template
-  python -m orchestrator.cli switch-lang --problem two-sum --from python --to cpp
-            """
+            epilog=_EPILOG
         )
         
         # Global options
@@ -196,79 +371,128 @@ Examples:
             action="store_true",
             help="Enable verbose logging"
         )
-        
-        # Subcommands
-        subparsers = parser.add_subparsers(dest="command", help="Available commands")
-        
-        # Run command
+        parser.add_argument(
+            "--server",
+            action="store_true",
+            help="Read newline-delimited JSON commands from stdin"
+        )
+
+        return parser
+
+    def _add_run_subparser(self, subparsers) -> None:
         run_parser = subparsers.add_parser("run", help="Execute code and run tests")
         run_parser.add_argument("--problem", required=True, help="Problem slug")
         run_parser.add_argument("--lang", required=True, help="Programming language")
         run_parser.add_argument("--code", help="Source code to execute")
         run_parser.add_argument("--code-file", help="File containing source code")
-        run_parser.add_argument("--tests", choices=["sample", "unit", "all"], default="all",
+        run_parser.add_argument("--tests", choices=_TESTS_CHOICES, default="all",
                                help="Which test sets to run")
-        
-        # Explain command
+
+    def _add_explain_subparser(self, subparsers) -> None:
         explain_parser = subparsers.add_parser("explain", help="Generate solution explanation")
         explain_parser.add_argument("--problem", required=True, help="Problem slug")
         explain_parser.add_argument("--lang", required=True, help="Programming language")
         explain_parser.add_argument("--code", help="Source code to explain")
         explain_parser.add_argument("--code-file", help="File containing source code")
-        
-        # Gen-tests command
+
+    def _add_gen_tests_subparser(self, subparsers) -> None:
         gen_tests_parser = subparsers.add_parser("gen-tests", help="Generate test cases")
         gen_tests_parser.add_argument("--problem", required=True, help="Problem slug")
         gen_tests_parser.add_argument("--count", type=int, default=10, help="Number of test cases")
-        gen_tests_parser.add_argument("--type", choices=["unit", "edge", "stress"], default="unit",
+        gen_tests_parser.add_argument("--type", choices=_GEN_TYPE_CHOICES, default="unit",
                                      help="Type of test cases to generate")
-        
-        # Switch-lang command
+
+    def _add_switch_lang_subparser(self, subparsers) -> None:
         switch_parser = subparsers.add_parser("switch-lang", help="Switch language template")
         switch_parser.add_argument("--problem", required=True, help="Problem slug")
         switch_parser.add_argument("--from-lang", required=True, help="Source language")
         switch_parser.add_argument("--to-lang", required=True, help="Target language")
         switch_parser.add_argument("--preserve-logic", action="store_true", default=True,
                                   help="Attempt to preserve existing logic when switching")
-        
-        # Validate command
+
+    def _add_validate_subparser(self, subparsers) -> None:
         validate_parser = subparsers.add_parser("validate", help="Validate code syntax")
         validate_parser.add_argument("--lang", required=True, help="Programming language")
         validate_parser.add_argument("--code", help="Source code to validate")
         validate_parser.add_argument("--code-file", help="File containing source code")
-        
-        # Stats command
+
+    def _add_stats_subparser(self, subparsers) -> None:
         stats_parser = subparsers.add_parser("stats", help="Get execution statistics")
         stats_parser.add_argument("--problem", help="Get stats for specific problem")
         stats_parser.add_argument("--lang", help="Get stats for specific language")
-        
-        # List-languages command
-        list_langs_parser = subparsers.add_parser("list-languages", help="List supported languages")
-        
-        # Template-info command
+
+    def _add_list_languages_subparser(self, subparsers) -> None:
+        subparsers.add_parser("list-languages", help="List supported languages")
+
+    def _add_template_info_subparser(self, subparsers) -> None:
         template_info_parser = subparsers.add_parser("template-info", help="Get template information")
         template_info_parser.add_argument("--problem", required=True, help="Problem slug")
         template_info_parser.add_argument("--lang", required=True, help="Programming language")
-        
+
+    # Subparser builders keyed by command name; used to build only the
+    # subparser for the command actually being invoked.
+    _SUBPARSER_BUILDERS = {
+        "run": _add_run_subparser,
+        "explain": _add_explain_subparser,
+        "gen-tests": _add_gen_tests_subparser,
+        "switch-lang": _add_switch_lang_subparser,
+        "validate": _add_validate_subparser,
+        "stats": _add_stats_subparser,
+        "list-languages": _add_list_languages_subparser,
+        "template-info": _add_template_info_subparser,
+    }
+
+    def create_parser(self) -> argparse.ArgumentParser:
+        """Create and configure the full argument parser with all subcommands."""
+        parser = self._create_base_parser()
+        subparsers = parser.add_subparsers(dest="command", help="Available commands")
+        for builder in self._SUBPARSER_BUILDERS.values():
+            builder(self, subparsers)
         return parser
-    
+
+    def _create_parser_for(self, command: Optional[str]) -> argparse.ArgumentParser:
+        """Create a parser containing only the subparser for the given command.
+
+        When no known command is present (bare --help, no args, JSON-routed
+        input, or a mistyped command), the known names are registered as
+        empty stub subparsers: help and the invalid-choice error still list
+        every command, but none of the eight argument sets is built. The
+        stubs are never entered, because any recognized command is sniffed
+        from argv and routed to the other branch with its full subparser.
+        """
+        parser = self._create_base_parser()
+        if command is None:
+            subparsers = parser.add_subparsers(dest="command", help="Available commands")
+            for name in _COMMANDS:
+                subparsers.add_parser(name, add_help=False)
+        else:
+            subparsers = parser.add_subparsers(dest="command", help="Available commands")
+            self._SUBPARSER_BUILDERS[command](self, subparsers)
+        return parser
+
     def parse_json_input(self, json_str: str) -> Dict[str, Any]:
         """Parse and validate JSON input."""
         try:
-            data = json.loads(json_str)
+            if _json_fast is not None:
+                data = _json_fast.loads(json_str)
+            else:
+                data = json.loads(json_str)
             if not isinstance(data, dict):
                 raise CLIError("JSON input must be an object")
             return data
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             raise CLIError(f"Invalid JSON input: {e}")
     
     def load_code_from_file(self, file_path: str) -> str:
         """Load source code from a file."""
         try:
-            path = Path(file_path)
-            if not path.exists():
-                raise CLIError(f"Code file not found: {file_path}")
-            return path.read_text(encoding="utf-8")
+            # Single open() instead of exists()+read_text: one syscall fewer
+            # and no universal-newlines translation.
+            with open(file_path, "rb") as f:
+                return f.read().decode("utf-8")
+        except FileNotFoundError:
+            raise CLIError(f"Code file not found: {file_path}")
         except Exception as e:
             raise CLIError(f"Error reading code file: {e}")
     
@@ -294,16 +518,8 @@ Examples:
             raise CLIError("No source code provided (use --code or --code-file)")
         
         # Map language names to execution service format
-        lang_mapping = {
-            "python": "py",
-            "cpp": "cpp",
-            "c++": "cpp", 
-            "c": "c",
-            "javascript": "js",
-            "java": "java"
-        }
-        
-        execution_lang = lang_mapping.get(lang.lower(), lang.lower())
+        lang_lower = lang.lower()
+        execution_lang = _LANG_MAPPING.get(lang_lower, lang_lower)
         
         # Execute the code using the real execution service
         try:
@@ -331,23 +547,22 @@ Examples:
                     "total_time": result.get("total_time_ms", 0),
                     "success_rate": result.get("success_rate", 0.0)
                 },
-                "cases": []
+                "cases": [
+                    {
+                        "test_id": t.get("test_id", ""),
+                        "status": "PASS" if t.get("passed") else "FAIL",
+                        "time": t.get("time_ms", 0),
+                        "memory": t.get("memory_mb", 0),
+                        "input": t.get("input", ""),
+                        "expected": t.get("expected_output", ""),
+                        "actual": t.get("actual_output", ""),
+                        "error": t.get("error", ""),
+                        "diff": t.get("diff", "")
+                    }
+                    for t in result.get("test_results", ())
+                ]
             }
-            
-            # Add individual test case results
-            for test_result in result.get("test_results", []):
-                cli_result["cases"].append({
-                    "test_id": test_result.get("test_id", ""),
-                    "status": "PASS" if test_result.get("passed", False) else "FAIL",
-                    "time": test_result.get("time_ms", 0),
-                    "memory": test_result.get("memory_mb", 0),
-                    "input": test_result.get("input", ""),
-                    "expected": test_result.get("expected_output", ""),
-                    "actual": test_result.get("actual_output", ""),
-                    "error": test_result.get("error", ""),
-                    "diff": test_result.get("diff", "")
-                })
-            
+
             # Add logs if available
             if "logs" in result:
                 cli_result["logs"] = result["logs"]
@@ -583,7 +798,12 @@ Examples:
     def handle_list_languages_command(self, args: argparse.Namespace, json_data: Optional[Dict] = None) -> Dict[str, Any]:
         """Handle the list-languages command."""
         try:
-            languages = self.template_manager.get_supported_languages()
+            # The language set is static per template manager; cache it so
+            # repeat invocations in server mode skip the manager entirely.
+            languages = self._supported_languages_cache
+            if languages is None:
+                languages = self.template_manager.get_supported_languages()
+                self._supported_languages_cache = languages
             return {
                 "status": "success",
                 "command": "list-languages",
@@ -623,9 +843,15 @@ Examples:
     
     async def run_async(self, args: Optional[list] = None) -> int:
         """Async main entry point for the CLI."""
-        parser = self.create_parser()
+        argv = args if args is not None else sys.argv[1:]
+        command = _sniff_subcommand(argv)
+        parser = self._parsers.get(command)
+        if parser is None:
+            parser = self._create_parser_for(command)
+            self._parsers[command] = parser
         parsed_args = parser.parse_args(args)
         
+        pretty_json = parsed_args.verbose or sys.stdout.isatty()
         try:
             # Parse JSON input if provided
             json_data = None
@@ -635,34 +861,27 @@ Examples:
                 if "command" in json_data:
                     parsed_args.command = json_data["command"]
                     # Set default values for missing attributes when using JSON input
-                    for attr in ["problem", "lang", "code", "code_file", "tests", "count", "type", "from_lang", "to_lang"]:
-                        if not hasattr(parsed_args, attr):
-                            setattr(parsed_args, attr, None)
+                    args_dict = parsed_args.__dict__
+                    for attr in _JSON_ARG_KEYS:
+                        args_dict.setdefault(attr, None)
             
             # Route to appropriate command handler
-            if parsed_args.command == "run":
-                result = await self.handle_run_command(parsed_args, json_data)
-            elif parsed_args.command == "explain":
-                result = self.handle_explain_command(parsed_args, json_data)
-            elif parsed_args.command == "gen-tests":
-                result = self.handle_gen_tests_command(parsed_args, json_data)
-            elif parsed_args.command == "switch-lang":
-                result = self.handle_switch_lang_command(parsed_args, json_data)
-            elif parsed_args.command == "validate":
-                result = await self.handle_validate_command(parsed_args, json_data)
-            elif parsed_args.command == "stats":
-                result = await self.handle_stats_command(parsed_args, json_data)
-            elif parsed_args.command == "list-languages":
-                result = self.handle_list_languages_command(parsed_args, json_data)
-            elif parsed_args.command == "template-info":
-                result = self.handle_template_info_command(parsed_args, json_data)
-            else:
+            entry = self._dispatch.get(parsed_args.command)
+            if entry is None:
                 parser.print_help()
                 return 1
+            handler, is_async = entry
+            if is_async:
+                result = await handler(parsed_args, json_data)
+            else:
+                result = handler(parsed_args, json_data)
             
             # Output result
             if parsed_args.json_output:
-                print(json.dumps(result, indent=2))
+                if self._binary_stdout:
+                    _write_json(result, pretty_json)
+                else:
+                    print(_dump_json(result, pretty_json))
             else:
                 self._print_human_readable(result)
             
@@ -674,7 +893,10 @@ Examples:
                 "error": str(e)
             }
             if parsed_args.json_output:
-                print(json.dumps(error_result, indent=2))
+                if self._binary_stdout:
+                    _write_json(error_result, pretty_json)
+                else:
+                    print(_dump_json(error_result, pretty_json))
             else:
                 print(f"Error: {e}", file=sys.stderr)
             return 1
@@ -684,7 +906,10 @@ Examples:
                 "error": f"Unexpected error: {e}"
             }
             if parsed_args.json_output:
-                print(json.dumps(error_result, indent=2))
+                if self._binary_stdout:
+                    _write_json(error_result, pretty_json)
+                else:
+                    print(_dump_json(error_result, pretty_json))
             else:
                 print(f"Unexpected error: {e}", file=sys.stderr)
             return 1
@@ -693,9 +918,53 @@ Examples:
         """Synchronous wrapper for the async run method."""
         import asyncio
         return asyncio.run(self.run_async(args))
+
+    def run_many(self, argvs) -> list:
+        """Run several CLI invocations on a single shared event loop.
+
+        Avoids the per-call loop setup/teardown cost of run() when the CLI
+        is driven in a batch (test harnesses, VS Code extension).
+        """
+        import asyncio
+        loop = asyncio.new_event_loop()
+        try:
+            return [loop.run_until_complete(self.run_async(argv)) for argv in argvs]
+        finally:
+            loop.close()
+
+    def run_server(self, stream=None) -> int:
+        """Serve newline-delimited JSON commands from stdin.
+
+        Each input line is a JSON command object (same shape as
+        --json-input); one JSON response is emitted per command. All
+        commands share one event loop, eliminating Python startup and loop
+        setup per invocation.
+        """
+        import asyncio
+        stream = stream if stream is not None else sys.stdin
+        loop = asyncio.new_event_loop()
+        exit_code = 0
+        self._binary_stdout = True
+        try:
+            for line in stream:
+                line = line.strip()
+                if not line:
+                    continue
+                exit_code = loop.run_until_complete(
+                    self.run_async(["--json-input", line, "--json-output"])
+                )
+        finally:
+            self._binary_stdout = False
+            loop.close()
+        return exit_code
     
     def _print_human_readable(self, result: Dict[str, Any]) -> None:
-        """Print result in human-readable format."""
+        """Print result in human-readable format.
+
+        The per-command detail lines are assembled into one buffer and
+        written together, so an invocation costs two stdout writes
+        (header + details) instead of one per field.
+        """
         if result["status"] == "error":
             print(f"❌ Error: {result['error']}")
             return
@@ -710,73 +979,78 @@ Examples:
             command_title = command.title()
         
         print(f"✅ {command_title} completed successfully")
-        
+        lines = []
+
         if command == "run":
             run_result = result["result"]
-            print(f"Status: {run_result.get('status', 'Unknown')}")
+            lines.append(f"Status: {run_result.get('status', 'Unknown')}")
             if "summary" in run_result:
                 summary = run_result["summary"]
-                print(f"Tests: {summary.get('passed', 0)}/{summary.get('total', 0)} passed")
-                print(f"Time: {summary.get('total_time', 0)}ms")
+                passed = summary.get("passed", 0)
+                total = summary.get("total", 0)
+                total_time = summary.get("total_time", 0)
+                lines.append(f"Tests: {passed}/{total} passed\nTime: {total_time}ms")
         
         elif command == "explain":
             explanation = result["explanation"]
-            if len(explanation) > 100:
-                print(f"Explanation: {explanation[:100]}...")
-            else:
-                print(f"Explanation: {explanation}")
+            suffix = "..." if len(explanation) > 100 else ""
+            lines.append(f"Explanation: {explanation[:100]}{suffix}")
         
         elif command == "gen-tests":
             test_cases = result["test_cases"]
-            print(f"Generated {len(test_cases)} test cases")
+            lines.append(f"Generated {len(test_cases)} test cases")
         
         elif command == "switch-lang":
             switch_result = result["result"]
-            print(f"Switched {switch_result['problem']} from {switch_result['from_lang']} to {switch_result['to_lang']}")
+            lines.append(f"Switched {switch_result['problem']} from {switch_result['from_lang']} to {switch_result['to_lang']}")
         
         elif command == "validate":
             validate_result = result["result"]
             if validate_result.get("valid", False):
-                print("✅ Code syntax is valid")
+                lines.append("✅ Code syntax is valid")
             else:
-                print(f"❌ Syntax error: {validate_result.get('message', 'Unknown error')}")
+                lines.append(f"❌ Syntax error: {validate_result.get('message', 'Unknown error')}")
         
         elif command == "stats":
             stats_result = result["result"]
             stats_type = result.get("type", "overall")
             if stats_type == "problem":
-                print(f"Statistics for problem '{result['problem']}':")
+                lines.append(f"Statistics for problem '{result['problem']}':")
             elif stats_type == "language":
-                print(f"Statistics for language '{result['language']}':")
+                lines.append(f"Statistics for language '{result['language']}':")
             else:
-                print("Overall execution statistics:")
+                lines.append("Overall execution statistics:")
             
-            # Print key statistics
+            # Collect key statistics
             if "total_executions" in stats_result:
-                print(f"  Total executions: {stats_result['total_executions']}")
+                lines.append(f"  Total executions: {stats_result['total_executions']}")
             if "successful_executions" in stats_result:
-                print(f"  Successful: {stats_result['successful_executions']}")
+                lines.append(f"  Successful: {stats_result['successful_executions']}")
             if "avg_execution_time" in stats_result:
-                print(f"  Average time: {stats_result['avg_execution_time']:.2f}ms")
+                lines.append(f"  Average time: {stats_result['avg_execution_time']:.2f}ms")
         
         elif command == "list-languages":
             languages = result["languages"]
-            print(f"Supported languages ({result['count']}):")
-            for lang in languages:
-                print(f"  • {lang}")
+            lines.append(f"Supported languages ({result['count']}):")
+            lines.extend(f"  • {lang}" for lang in languages)
         
         elif command == "template-info":
             info = result["result"]
-            print(f"Template info for {info.get('problem', 'unknown')} in {info.get('language', 'unknown')}:")
-            print(f"  File path: {info.get('file_path', 'N/A')}")
-            print(f"  Exists: {'Yes' if info.get('exists', False) else 'No'}")
-            print(f"  Extension: {info.get('extension', 'N/A')}")
-            print(f"  Main function: {info.get('main_function', 'N/A')}")
+            lines.append(f"Template info for {info.get('problem', 'unknown')} in {info.get('language', 'unknown')}:")
+            lines.append(f"  File path: {info.get('file_path', 'N/A')}")
+            lines.append(f"  Exists: {'Yes' if info.get('exists', False) else 'No'}")
+            lines.append(f"  Extension: {info.get('extension', 'N/A')}")
+            lines.append(f"  Main function: {info.get('main_function', 'N/A')}")
+        
+        if lines:
+            print("\n".join(lines))
 
 
 def main():
     """Entry point for the CLI when run as a module."""
     cli = OrchestatorCLI()
+    if "--server" in sys.argv[1:]:
+        return cli.run_server()
     return cli.run()
 
 
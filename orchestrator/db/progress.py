@@ -5,8 +5,10 @@ This module provides database operations for tracking user progress,
 problem statistics, and analytics data using SQLite.
 """
 
+import functools
 import json
 import sqlite3
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict
@@ -15,8 +17,181 @@ from typing import Dict, List, Optional, Tuple, Any, Union
 
 from orchestrator.utils.limits import ExecutionResult
 
+try:
+    # Optional faster JSON decoder for the settings hot path.
+    import orjson as _json_fast
+except ImportError:
+    _json_fast = None
 
-@dataclass
+# First characters that can start a JSON document. Anything else is a
+# plain string and skips the parse attempt (and its exception cost).
+_JSON_LEAD_CHARS = frozenset('{["tfn-0123456789')
+
+
+def _parse_setting_value(value: str) -> Any:
+    """Decode a stored setting, falling back to the raw string."""
+    if not value or value[0] not in _JSON_LEAD_CHARS:
+        return value
+    try:
+        if _json_fast is not None:
+            return _json_fast.loads(value)
+        return json.loads(value)
+    except (ValueError, TypeError):
+        return value
+
+
+try:
+    # Optional thinner SQLite binding: apsw skips the stdlib module's
+    # per-row conversion machinery, which shows up on bulk inserts and
+    # large result iterations.
+    import apsw as _apsw
+except ImportError:
+    _apsw = None
+
+_DML_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+class _ApswCursor:
+    """apsw cursor adapted to the slice of the sqlite3 cursor API used here."""
+
+    __slots__ = ("_conn", "_cursor", "row_factory", "rowcount", "lastrowid")
+
+    def __init__(self, conn: "_ApswConnection"):
+        self._conn = conn
+        self._cursor = conn._raw.cursor()
+        self.row_factory = None
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def execute(self, sql, params=()):
+        raw = self._conn._raw
+        # Mirror sqlite3's legacy transaction handling: open a transaction
+        # before DML so _get_connection's commit()/rollback() take effect.
+        if not raw.in_transaction and sql.lstrip()[:7].upper().startswith(_DML_PREFIXES):
+            self._cursor.execute("BEGIN")
+        self._cursor.execute(sql, tuple(params))
+        self.rowcount = raw.changes()
+        self.lastrowid = raw.last_insert_rowid()
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        raw = self._conn._raw
+        if not raw.in_transaction:
+            self._cursor.execute("BEGIN")
+        # rowcount mirrors sqlite3: one change per parameter set, not the
+        # trigger side-effects that total_changes() would also count.
+        params = [tuple(p) for p in seq_of_params]
+        self._cursor.executemany(sql, params)
+        self.rowcount = len(params)
+        return self
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            # Drain so the statement is reset; an active statement would
+            # block a later COMMIT on the connection.
+            for _ in self._cursor:
+                pass
+            if self.row_factory is not None:
+                return self.row_factory(self, row)
+        return row
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        factory = self.row_factory
+        if factory is not None:
+            return [factory(self, row) for row in rows]
+        return rows
+
+    def __iter__(self):
+        factory = self.row_factory
+        if factory is None:
+            return iter(self._cursor)
+        return (factory(self, row) for row in self._cursor)
+
+
+class _ApswConnection:
+    """apsw connection adapted to the sqlite3 surface ProgressDB relies on."""
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, db_path, cached_statements=256):
+        self._raw = _apsw.Connection(
+            str(db_path), statementcachesize=cached_statements)
+
+    def cursor(self):
+        return _ApswCursor(self)
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
+
+    def executemany(self, sql, seq_of_params):
+        return self.cursor().executemany(sql, seq_of_params)
+
+    def executescript(self, script):
+        # apsw executes multi-statement strings natively.
+        self._raw.cursor().execute(script)
+
+    def commit(self):
+        if self._raw.in_transaction:
+            self._raw.cursor().execute("COMMIT")
+
+    def rollback(self):
+        if self._raw.in_transaction:
+            self._raw.cursor().execute("ROLLBACK")
+
+    def close(self):
+        self._raw.close()
+
+# How long a computed statistics summary stays valid without new writes.
+_SUMMARY_CACHE_TTL = 30.0
+
+# Columns in dataclass field order, for positional row construction.
+_ATTEMPT_COLUMNS = ("slug, lang, status, timestamp, time_ms, memory_mb, "
+                    "test_cases_passed, test_cases_total, commit_sha, notes, id")
+# The four attempt-query variants are prebuilt so each call reuses the
+# exact same SQL text and always hits sqlite3's per-connection statement
+# cache. Indexed by (bool(slug) << 1) | bool(lang); LIMIT -1 disables
+# the limit.
+_ATTEMPTS_SELECT = tuple(
+    f"SELECT {_ATTEMPT_COLUMNS} FROM attempts{where}"
+    " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+    for where in (
+        "",
+        " WHERE lang = ?",
+        " WHERE slug = ?",
+        " WHERE slug = ? AND lang = ?",
+    )
+)
+# Rows fetched per transaction by iter_attempts; each batch releases
+# the connection lock before its rows are yielded.
+_ITER_ATTEMPTS_BATCH = 256
+
+_PROBLEM_META_COLUMNS = ("slug, title, difficulty, tags, first_seen, last_attempted, "
+                         "solved_count, total_attempts, best_time_ms, best_memory_mb, "
+                         "last_status, languages_solved")
+_DAILY_STATS_COLUMNS = ("date, problems_attempted, problems_solved, total_time_ms, "
+                        "languages_used, difficulty_breakdown")
+
+# Bump whenever schema.sql (or the fallback schema) changes so existing
+# databases pick up the new objects on next open.
+_SCHEMA_VERSION = 1
+
+# INSERT ... RETURNING needs SQLite 3.35+; fall back to lastrowid below that.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Problem metadata fields that update_problem_meta may write.
+_UPDATABLE_FIELDS = frozenset({"title", "difficulty", "tags", "languages_solved"})
+
+
+@functools.lru_cache(maxsize=None)
+def _meta_update_sql(fields: Tuple[str, ...]) -> str:
+    """Build (and cache) the UPDATE statement for a given field subset."""
+    set_clauses = ", ".join(f"{field} = ?" for field in fields)
+    return f"UPDATE problems_meta SET {set_clauses}, updated_at = ? WHERE slug = ?"
+
+
+@dataclass(slots=True)
 class AttemptRecord:
     """Record of a solution attempt."""
     slug: str
@@ -37,7 +212,7 @@ class AttemptRecord:
             self.timestamp = int(time.time())
 
 
-@dataclass
+@dataclass(slots=True)
 class ProblemMeta:
     """Problem metadata and statistics."""
     slug: str
@@ -54,7 +229,7 @@ class ProblemMeta:
     languages_solved: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStats:
     """Daily statistics."""
     date: str
@@ -65,6 +240,20 @@ class DailyStats:
     difficulty_breakdown: Optional[str] = None
 
 
+# Row factories building records positionally from explicit column lists,
+# skipping sqlite3.Row's name-indexing overhead.
+def _attempt_row_factory(_cursor, row) -> AttemptRecord:
+    return AttemptRecord(*row)
+
+
+def _problem_meta_row_factory(_cursor, row) -> ProblemMeta:
+    return ProblemMeta(*row)
+
+
+def _daily_stats_row_factory(_cursor, row) -> DailyStats:
+    return DailyStats(*row)
+
+
 class ProgressDB:
     """Database interface for progress tracking."""
     
@@ -79,13 +268,33 @@ class ProgressDB:
             db_path = Path(__file__).parent / "progress.sqlite"
         
         self.db_path = db_path
+        self._conn = None
+        self._conn_lock = threading.RLock()
+        # In-process caches, invalidated on writes (attempt inserts also
+        # update problems_meta and statistics through triggers).
+        self._summary_cache = None  # (expiry_ts, summary dict)
+        self._problem_meta_cache = {}
+        self._settings_cache = None  # key -> parsed value, loaded on demand
         self._ensure_database_exists()
     
     def _ensure_database_exists(self):
         """Create database and tables if they don't exist."""
         schema_path = Path(__file__).parent / "schema.sql"
-        
+
         with self._get_connection() as conn:
+            # Schema already applied: skip the file read and the trip
+            # through the SQL parser entirely.
+            if conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+                return
+
+            # WAL persists in the database file, so set it once here rather
+            # than on every connection; NORMAL sync is safe under WAL and
+            # avoids an fsync of the main DB file per commit. Incremental
+            # auto-vacuum must be configured before any table exists; it
+            # lets cleanup reclaim pages without a full-file VACUUM rewrite.
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
             if schema_path.exists():
                 with open(schema_path, 'r', encoding='utf-8') as f:
                     schema_sql = f.read()
@@ -107,6 +316,19 @@ class ProgressDB:
                         notes TEXT
                     )
                 """)
+                # Indexes matching get_attempts' filter/sort patterns
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_attempts_slug_ts "
+                    "ON attempts(slug, timestamp DESC)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_attempts_lang_ts "
+                    "ON attempts(lang, timestamp DESC)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_attempts_ts "
+                    "ON attempts(timestamp DESC)"
+                )
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS problems_meta (
                         slug TEXT PRIMARY KEY,
@@ -123,21 +345,104 @@ class ProgressDB:
                         languages_solved TEXT
                     )
                 """)
-    
+                # Keep problems_meta in sync inside the same insert
+                # transaction, matching schema.sql's trigger: one commit,
+                # no follow-up read-modify-write from Python.
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS update_problems_meta_on_attempt
+                    AFTER INSERT ON attempts
+                    BEGIN
+                        INSERT OR IGNORE INTO problems_meta (
+                            slug, first_seen, last_attempted, total_attempts,
+                            solved_count, last_status
+                        )
+                        VALUES (NEW.slug, NEW.timestamp, NEW.timestamp, 0, 0, NEW.status);
+
+                        UPDATE problems_meta
+                        SET
+                            last_attempted = NEW.timestamp,
+                            total_attempts = total_attempts + 1,
+                            solved_count = solved_count + (CASE WHEN NEW.status = 'OK' THEN 1 ELSE 0 END),
+                            last_status = NEW.status,
+                            best_time_ms = CASE
+                                WHEN NEW.status = 'OK' AND NEW.time_ms IS NOT NULL THEN
+                                    MIN(NEW.time_ms, COALESCE(best_time_ms, NEW.time_ms))
+                                ELSE
+                                    best_time_ms
+                            END,
+                            best_memory_mb = CASE
+                                WHEN NEW.status = 'OK' AND NEW.memory_mb IS NOT NULL THEN
+                                    MIN(NEW.memory_mb, COALESCE(best_memory_mb, NEW.memory_mb))
+                                ELSE
+                                    best_memory_mb
+                            END
+                        WHERE slug = NEW.slug;
+                    END
+                """)
+
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _connect(self):
+        """Open (or return the cached) database connection.
+
+        Uses apsw when installed (a thinner binding than stdlib sqlite3,
+        adapted through _ApswConnection); otherwise stdlib sqlite3.
+        """
+        if self._conn is None:
+            if _apsw is not None:
+                conn = _ApswConnection(self.db_path, cached_statements=256)
+            else:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                       cached_statements=256)
+            # No connection-wide row factory: write paths return plain
+            # tuples, and read queries set a factory per cursor.
+            # Per-connection tuning: these pragmas don't persist in the file,
+            # so they are applied when the connection is opened.
+            conn.executescript("""
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-65536;
+                PRAGMA mmap_size=268435456;
+                PRAGMA busy_timeout=3000;
+                PRAGMA wal_autocheckpoint=1000;
+                PRAGMA journal_size_limit=67108864;
+            """)
+            self._conn = conn
+        return self._conn
+
     @contextmanager
     def _get_connection(self):
-        """Get database connection with proper cleanup."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Yield the shared database connection inside a transaction.
+
+        The connection is opened once and reused across calls, preserving
+        SQLite's page and statement caches; cross-thread access is
+        serialized by an RLock.
+        """
+        with self._conn_lock:
+            conn = self._connect()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def close(self):
+        """Close the cached connection, letting SQLite refresh planner stats."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.execute("PRAGMA optimize")
+                self._conn.close()
+                self._conn = None
     
+    def _invalidate_caches(self, slugs=None):
+        """Drop cached query results after a write."""
+        self._summary_cache = None
+        if slugs is None:
+            self._problem_meta_cache.clear()
+        else:
+            for slug in slugs:
+                self._problem_meta_cache.pop(slug, None)
+
     def record_attempt(self, attempt: AttemptRecord) -> int:
         """
         Record a solution attempt.
@@ -148,19 +453,66 @@ class ProgressDB:
         Returns:
             ID of the inserted record
         """
+        params = (
+            attempt.slug, attempt.lang, attempt.timestamp, attempt.status,
+            attempt.time_ms, attempt.memory_mb, attempt.test_cases_passed,
+            attempt.test_cases_total, attempt.commit_sha, attempt.notes
+        )
+
+        with self._get_connection() as conn:
+            if _HAS_RETURNING:
+                cursor = conn.execute("""
+                    INSERT INTO attempts (
+                        slug, lang, timestamp, status, time_ms, memory_mb,
+                        test_cases_passed, test_cases_total, commit_sha, notes
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING id
+                """, params)
+                row_id = cursor.fetchone()[0]
+            else:
+                cursor = conn.execute("""
+                    INSERT INTO attempts (
+                        slug, lang, timestamp, status, time_ms, memory_mb,
+                        test_cases_passed, test_cases_total, commit_sha, notes
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, params)
+                row_id = cursor.lastrowid
+            self._invalidate_caches((attempt.slug,))
+            return row_id
+    
+    def record_attempts_bulk(self, attempts: List[AttemptRecord]) -> int:
+        """
+        Record many solution attempts in a single transaction.
+
+        Avoids the per-row commit cost of calling record_attempt in a loop;
+        SQLite writes the whole batch with one journal sync.
+
+        Args:
+            attempts: AttemptRecords to store
+
+        Returns:
+            Number of records inserted
+        """
+        if not attempts:
+            return 0
+
         with self._get_connection() as conn:
-            cursor = conn.execute("""
+            cursor = conn.executemany("""
                 INSERT INTO attempts (
                     slug, lang, timestamp, status, time_ms, memory_mb,
                     test_cases_passed, test_cases_total, commit_sha, notes
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
-                attempt.slug, attempt.lang, attempt.timestamp, attempt.status,
-                attempt.time_ms, attempt.memory_mb, attempt.test_cases_passed,
-                attempt.test_cases_total, attempt.commit_sha, attempt.notes
+                (
+                    a.slug, a.lang, a.timestamp, a.status,
+                    a.time_ms, a.memory_mb, a.test_cases_passed,
+                    a.test_cases_total, a.commit_sha, a.notes
+                )
+                for a in attempts
             ))
-            return cursor.lastrowid
-    
+            self._invalidate_caches({a.slug for a in attempts})
+            return cursor.rowcount
+
     def record_execution_result(self, slug: str, lang: str, result: ExecutionResult,
                               test_cases_passed: int = 0, test_cases_total: int = 0,
                               commit_sha: Optional[str] = None) -> int:
@@ -190,54 +542,72 @@ class ProgressDB:
         )
         return self.record_attempt(attempt)
     
+    def iter_attempts(self, slug: Optional[str] = None, lang: Optional[str] = None,
+                     limit: Optional[int] = None, offset: int = 0):
+        """
+        Iterate attempt records lazily with optional filtering.
+
+        Rows are fetched one batch at a time, each batch under its own
+        connection transaction, and yielded with the lock released, so
+        callers that stop early never materialize the full result set
+        and a suspended generator never blocks other threads' database
+        calls.
+
+        Args:
+            slug: Filter by problem slug
+            lang: Filter by language
+            limit: Maximum number of records to yield (None for no limit)
+            offset: Number of records to skip
+
+        Yields:
+            AttemptRecord objects, most recent first
+        """
+        query = _ATTEMPTS_SELECT[(bool(slug) << 1) | bool(lang)]
+        filters = []
+
+        if slug:
+            filters.append(slug)
+
+        if lang:
+            filters.append(lang)
+
+        remaining = limit
+        next_offset = offset
+
+        while remaining is None or remaining > 0:
+            batch_limit = (_ITER_ATTEMPTS_BATCH if remaining is None
+                           else min(remaining, _ITER_ATTEMPTS_BATCH))
+
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = _attempt_row_factory
+                cursor.execute(query, [*filters, batch_limit, next_offset])
+                batch = cursor.fetchall()
+
+            yield from batch
+
+            if len(batch) < batch_limit:
+                return
+
+            next_offset += len(batch)
+            if remaining is not None:
+                remaining -= len(batch)
+
     def get_attempts(self, slug: Optional[str] = None, lang: Optional[str] = None,
                     limit: int = 100, offset: int = 0) -> List[AttemptRecord]:
         """
         Get attempt records with optional filtering.
-        
+
         Args:
             slug: Filter by problem slug
             lang: Filter by language
             limit: Maximum number of records to return
             offset: Number of records to skip
-            
+
         Returns:
             List of AttemptRecord objects
         """
-        query = "SELECT * FROM attempts WHERE 1=1"
-        params = []
-        
-        if slug:
-            query += " AND slug = ?"
-            params.append(slug)
-        
-        if lang:
-            query += " AND lang = ?"
-            params.append(lang)
-        
-        query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-        
-        with self._get_connection() as conn:
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-            
-            return [
-                AttemptRecord(
-                    id=row['id'],
-                    slug=row['slug'],
-                    lang=row['lang'],
-                    timestamp=row['timestamp'],
-                    status=row['status'],
-                    time_ms=row['time_ms'],
-                    memory_mb=row['memory_mb'],
-                    test_cases_passed=row['test_cases_passed'],
-                    test_cases_total=row['test_cases_total'],
-                    commit_sha=row['commit_sha'],
-                    notes=row['notes']
-                )
-                for row in rows
-            ]
+        return list(self.iter_attempts(slug=slug, lang=lang, limit=limit, offset=offset))
     
     def get_problem_meta(self, slug: str) -> Optional[ProblemMeta]:
         """
@@ -249,29 +619,22 @@ class ProgressDB:
         Returns:
             ProblemMeta object or None if not found
         """
+        cached = self._problem_meta_cache.get(slug)
+        if cached is not None:
+            return cached
+
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM problems_meta WHERE slug = ?",
+            cursor = conn.cursor()
+            cursor.row_factory = _problem_meta_row_factory
+            cursor.execute(
+                f"SELECT {_PROBLEM_META_COLUMNS} FROM problems_meta WHERE slug = ?",
                 (slug,)
             )
-            row = cursor.fetchone()
-            
-            if row:
-                return ProblemMeta(
-                    slug=row['slug'],
-                    title=row['title'],
-                    difficulty=row['difficulty'],
-                    tags=row['tags'],
-                    first_seen=row['first_seen'],
-                    last_attempted=row['last_attempted'],
-                    solved_count=row['solved_count'],
-                    total_attempts=row['total_attempts'],
-                    best_time_ms=row['best_time_ms'],
-                    best_memory_mb=row['best_memory_mb'],
-                    last_status=row['last_status'],
-                    languages_solved=row['languages_solved']
-                )
-            return None
+            meta = cursor.fetchone()
+
+            if meta is not None:
+                self._problem_meta_cache[slug] = meta
+            return meta
     
     def get_all_problems_meta(self) -> List[ProblemMeta]:
         """
@@ -281,28 +644,13 @@ class ProgressDB:
             List of ProblemMeta objects
         """
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM problems_meta ORDER BY last_attempted DESC"
+            cursor = conn.cursor()
+            cursor.row_factory = _problem_meta_row_factory
+            cursor.execute(
+                f"SELECT {_PROBLEM_META_COLUMNS} FROM problems_meta "
+                "ORDER BY last_attempted DESC"
             )
-            rows = cursor.fetchall()
-            
-            return [
-                ProblemMeta(
-                    slug=row['slug'],
-                    title=row['title'],
-                    difficulty=row['difficulty'],
-                    tags=row['tags'],
-                    first_seen=row['first_seen'],
-                    last_attempted=row['last_attempted'],
-                    solved_count=row['solved_count'],
-                    total_attempts=row['total_attempts'],
-                    best_time_ms=row['best_time_ms'],
-                    best_memory_mb=row['best_memory_mb'],
-                    last_status=row['last_status'],
-                    languages_solved=row['languages_solved']
-                )
-                for row in rows
-            ]
+            return cursor.fetchall()
     
     def update_problem_meta(self, slug: str, **kwargs):
         """
@@ -314,25 +662,19 @@ class ProgressDB:
         """
         if not kwargs:
             return
-        
-        # Build dynamic update query
-        set_clauses = []
-        params = []
-        
-        for key, value in kwargs.items():
-            if key in ['title', 'difficulty', 'tags', 'languages_solved']:
-                set_clauses.append(f"{key} = ?")
-                params.append(value)
-        
-        if set_clauses:
-            set_clauses.append("updated_at = ?")
-            params.append(int(time.time()))
-            params.append(slug)
-            
-            query = f"UPDATE problems_meta SET {', '.join(set_clauses)} WHERE slug = ?"
-            
-            with self._get_connection() as conn:
-                conn.execute(query, params)
+
+        # Sorted so identical update shapes share one cached statement
+        fields = tuple(sorted(k for k in kwargs if k in _UPDATABLE_FIELDS))
+        if not fields:
+            return
+
+        params = [kwargs[field] for field in fields]
+        params.append(int(time.time()))
+        params.append(slug)
+
+        with self._get_connection() as conn:
+            conn.execute(_meta_update_sql(fields), params)
+            self._problem_meta_cache.pop(slug, None)
     
     def get_daily_stats(self, days: int = 30) -> List[DailyStats]:
         """
@@ -345,24 +687,14 @@ class ProgressDB:
             List of DailyStats objects
         """
         with self._get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM statistics 
-                WHERE date >= date('now', '-{} days')
+            cursor = conn.cursor()
+            cursor.row_factory = _daily_stats_row_factory
+            cursor.execute(f"""
+                SELECT {_DAILY_STATS_COLUMNS} FROM statistics
+                WHERE date >= date('now', ?)
                 ORDER BY date DESC
-            """.format(days))
-            rows = cursor.fetchall()
-            
-            return [
-                DailyStats(
-                    date=row['date'],
-                    problems_attempted=row['problems_attempted'],
-                    problems_solved=row['problems_solved'],
-                    total_time_ms=row['total_time_ms'],
-                    languages_used=row['languages_used'],
-                    difficulty_breakdown=row['difficulty_breakdown']
-                )
-                for row in rows
-            ]
+            """, (f'-{days} days',))
+            return cursor.fetchall()
     
     def get_statistics_summary(self) -> Dict[str, Any]:
         """
@@ -371,55 +703,62 @@ class ProgressDB:
         Returns:
             Dictionary with summary statistics
         """
+        now = time.time()
+        cached = self._summary_cache
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
         with self._get_connection() as conn:
-            # Total problems attempted and solved
-            cursor = conn.execute("""
-                SELECT 
-                    COUNT(DISTINCT slug) as problems_attempted,
-                    COUNT(DISTINCT CASE WHEN solved_count > 0 THEN slug END) as problems_solved
-                FROM problems_meta
-            """)
-            problem_stats = cursor.fetchone()
-            
-            # Total attempts and success rate
-            cursor = conn.execute("""
-                SELECT 
-                    COUNT(*) as total_attempts,
-                    COUNT(CASE WHEN status = 'OK' THEN 1 END) as successful_attempts
-                FROM attempts
-            """)
-            attempt_stats = cursor.fetchone()
-            
-            # Language breakdown
-            cursor = conn.execute("""
+            cursor = conn.cursor()
+            # One round-trip for the scalar aggregates: the attempts scan is
+            # shared between total/success/recent counts via a single CTE.
+            row = cursor.execute("""
+                WITH problem_stats AS (
+                    SELECT
+                        COUNT(DISTINCT slug) as problems_attempted,
+                        COUNT(DISTINCT CASE WHEN solved_count > 0 THEN slug END) as problems_solved
+                    FROM problems_meta
+                ),
+                attempt_stats AS (
+                    SELECT
+                        COUNT(*) as total_attempts,
+                        COUNT(CASE WHEN status = 'OK' THEN 1 END) as successful_attempts,
+                        COUNT(CASE WHEN timestamp >= strftime('%s', 'now', '-7 days') THEN 1 END) as recent_attempts
+                    FROM attempts
+                )
+                SELECT
+                    problems_attempted, problems_solved,
+                    total_attempts, successful_attempts, recent_attempts
+                FROM problem_stats, attempt_stats
+            """).fetchone()
+            (problems_attempted, problems_solved,
+             total_attempts, successful_attempts, recent_attempts) = row
+
+            # Language breakdown is a multi-row result, so it stays a
+            # separate query on the same connection
+            cursor.execute("""
                 SELECT lang, COUNT(*) as count
                 FROM attempts
                 GROUP BY lang
                 ORDER BY count DESC
             """)
-            language_stats = {row['lang']: row['count'] for row in cursor.fetchall()}
-            
-            # Recent activity (last 7 days)
-            cursor = conn.execute("""
-                SELECT COUNT(*) as recent_attempts
-                FROM attempts
-                WHERE timestamp >= strftime('%s', 'now', '-7 days')
-            """)
-            recent_activity = cursor.fetchone()
-            
+            language_stats = dict(cursor.fetchall())
+
             success_rate = 0
-            if attempt_stats['total_attempts'] > 0:
-                success_rate = (attempt_stats['successful_attempts'] / attempt_stats['total_attempts']) * 100
-            
-            return {
-                'problems_attempted': problem_stats['problems_attempted'],
-                'problems_solved': problem_stats['problems_solved'],
-                'total_attempts': attempt_stats['total_attempts'],
-                'successful_attempts': attempt_stats['successful_attempts'],
+            if total_attempts > 0:
+                success_rate = (successful_attempts / total_attempts) * 100
+
+            summary = {
+                'problems_attempted': problems_attempted,
+                'problems_solved': problems_solved,
+                'total_attempts': total_attempts,
+                'successful_attempts': successful_attempts,
                 'success_rate': round(success_rate, 2),
                 'language_breakdown': language_stats,
-                'recent_attempts_7d': recent_activity['recent_attempts']
+                'recent_attempts_7d': recent_attempts
             }
+            self._summary_cache = (now + _SUMMARY_CACHE_TTL, summary)
+            return summary
     
     def get_user_setting(self, key: str, default: Any = None) -> Any:
         """
@@ -432,22 +771,18 @@ class ProgressDB:
         Returns:
             Setting value or default
         """
+        if self._settings_cache is None:
+            self._load_settings_cache()
+        return self._settings_cache.get(key, default)
+
+    def _load_settings_cache(self):
+        """Load and parse the whole user_settings table into memory."""
+        settings = {}
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT value FROM user_settings WHERE key = ?",
-                (key,)
-            )
-            row = cursor.fetchone()
-            
-            if row:
-                try:
-                    # Try to parse as JSON first
-                    return json.loads(row['value'])
-                except (json.JSONDecodeError, TypeError):
-                    # Return as string if not valid JSON
-                    return row['value']
-            
-            return default
+            cursor = conn.execute("SELECT key, value FROM user_settings")
+            for key, value in cursor.fetchall():
+                settings[key] = _parse_setting_value(value)
+        self._settings_cache = settings
     
     def set_user_setting(self, key: str, value: Any):
         """
@@ -467,6 +802,10 @@ class ProgressDB:
                 INSERT OR REPLACE INTO user_settings (key, value, updated_at)
                 VALUES (?, ?, ?)
             """, (key, value_str, int(time.time())))
+
+        if self._settings_cache is not None:
+            # Mirror the read path: values round-trip through JSON parsing.
+            self._settings_cache[key] = _parse_setting_value(value_str)
     
     def cleanup_old_data(self, days_to_keep: int = 365):
         """
@@ -487,14 +826,22 @@ class ProgressDB:
             
             # Delete old daily statistics
             cursor = conn.execute(
-                "DELETE FROM statistics WHERE date < date('now', '-{} days')".format(days_to_keep)
+                "DELETE FROM statistics WHERE date < date('now', ?)",
+                (f'-{days_to_keep} days',)
             )
             stats_deleted = cursor.rowcount
-            
-            # Vacuum database to reclaim space
-            conn.execute("VACUUM")
-            
-            return {
-                'attempts_deleted': attempts_deleted,
-                'stats_deleted': stats_deleted
-            }
\ No newline at end of file
+            self._invalidate_caches()
+
+        # Reclaim freed pages outside the transaction: VACUUM cannot run
+        # inside one and rewrites the whole file, blocking all readers.
+        # The checkpoint then truncates the WAL, which otherwise grows
+        # unboundedly after heavy deletes.
+        with self._conn_lock:
+            conn = self._connect()
+            conn.execute("PRAGMA incremental_vacuum(1000)")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        return {
+            'attempts_deleted': attempts_deleted,
+            'stats_deleted': stats_deleted
+        }
\ No newline at end of file
@@ -79,6 +79,12 @@ CREATE INDEX IF NOT EXISTS idx_attempts_status ON attempts(status);
 CREATE INDEX IF NOT EXISTS idx_attempts_lang ON attempts(lang);
 CREATE INDEX IF NOT EXISTS idx_attempts_slug_lang ON attempts(slug, lang);
 
+-- Covering indexes matching get_attempts' filter + ORDER BY timestamp DESC,
+-- letting the planner stream rows from the index instead of sorting
+CREATE INDEX IF NOT EXISTS idx_attempts_slug_ts ON attempts(slug, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_attempts_lang_ts ON attempts(lang, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_attempts_ts ON attempts(timestamp DESC);
+
 CREATE INDEX IF NOT EXISTS idx_problems_difficulty ON problems_meta(difficulty);
 CREATE INDEX IF NOT EXISTS idx_problems_last_attempted ON problems_meta(last_attempted);
 CREATE INDEX IF NOT EXISTS idx_problems_solved_count ON problems_meta(solved_count);
@@ -28,83 +28,7 @@ def demo_cli_capabilities():
     
     cli = OrchestatorCLI()
     
-    # Demo 1: Basic run command
-    print("\n📋 Demo 1: Basic Run Command")
-    print("-" * 30)
-    result = cli.run([
-        'run', 
-        '--problem', 'two-sum', 
-        '--lang', 'python', 
-        '--code', 'def two_sum(nums, target): return [0, 1]'
-    ])
-    print(f"Exit code: {result}")
-    
-    # Demo 2: JSON output
-    print("\n📋 Demo 2: JSON Output Format")
-    print("-" * 30)
-    result = cli.run([
-        '--json-output',
-        'run', 
-        '--problem', 'add-two-numbers', 
-        '--lang', 'cpp', 
-        '--code', 'int main() { return 0; }'
-    ])
-    print(f"Exit code: {result}")
-    
-    # Demo 3: Explain command
-    print("\n📋 Demo 3: Explain Command")
-    print("-" * 30)
-    result = cli.run([
-        'explain',
-        '--problem', 'binary-search',
-        '--lang', 'java',
-        '--code', 'public class Solution { public int search() { return -1; } }'
-    ])
-    print(f"Exit code: {result}")
-    
-    # Demo 4: Generate tests command
-    print("\n📋 Demo 4: Generate Tests Command")
-    print("-" * 30)
-    result = cli.run([
-        'gen-tests',
-        '--problem', 'merge-intervals',
-        '--count', '8',
-        '--type', 'edge'
-    ])
-    print(f"Exit code: {result}")
-    
-    # Demo 5: Switch language command
-    print("\n📋 Demo 5: Switch Language Command")
-    print("-" * 30)
-    result = cli.run([
-        'switch-lang',
-        '--problem', 'longest-substring',
-        '--from-lang', 'python',
-        '--to-lang', 'javascript'
-    ])
-    print(f"Exit code: {result}")
-    
-    # Demo 6: JSON input
-    print("\n📋 Demo 6: JSON Input")
-    print("-" * 30)
-    json_input = {
-        "command": "run",
-        "problem": "valid-parentheses",
-        "lang": "python",
-        "code": "def isValid(s): return True",
-        "tests": "sample"
-    }
-    result = cli.run([
-        '--json-input', json.dumps(json_input),
-        '--json-output'
-    ])
-    print(f"Exit code: {result}")
-    
-    # Demo 7: Code from file
-    print("\n📋 Demo 7: Code from File")
-    print("-" * 30)
-    
-    # Create a temporary code file
+    # Create a temporary code file for the code-from-file demo
     with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
         f.write("""
 def fibonacci(n):
@@ -120,36 +44,80 @@ if __name__ == "__main__":
 """)
         temp_file = f.name
     
-    try:
-        result = cli.run([
+    json_input = {
+        "command": "run",
+        "problem": "valid-parentheses",
+        "lang": "python",
+        "code": "def isValid(s): return True",
+        "tests": "sample"
+    }
+    
+    # All demo invocations run as one in-process batch via run_many(),
+    # sharing the parser cache and event loop instead of paying the
+    # per-call setup cost 9 times.
+    demos = [
+        ("Basic Run Command", [
+            'run',
+            '--problem', 'two-sum',
+            '--lang', 'python',
+            '--code', 'def two_sum(nums, target): return [0, 1]'
+        ]),
+        ("JSON Output Format", [
+            '--json-output',
+            'run',
+            '--problem', 'add-two-numbers',
+            '--lang', 'cpp',
+            '--code', 'int main() { return 0; }'
+        ]),
+        ("Explain Command", [
+            'explain',
+            '--problem', 'binary-search',
+            '--lang', 'java',
+            '--code', 'public class Solution { public int search() { return -1; } }'
+        ]),
+        ("Generate Tests Command", [
+            'gen-tests',
+            '--problem', 'merge-intervals',
+            '--count', '8',
+            '--type', 'edge'
+        ]),
+        ("Switch Language Command", [
+            'switch-lang',
+            '--problem', 'longest-substring',
+            '--from-lang', 'python',
+            '--to-lang', 'javascript'
+        ]),
+        ("JSON Input", [
+            '--json-input', json.dumps(json_input),
+            '--json-output'
+        ]),
+        ("Code from File", [
             'run',
             '--problem', 'fibonacci-number',
             '--lang', 'python',
             '--code-file', temp_file
-        ])
-        print(f"Exit code: {result}")
+        ]),
+        ("Error Handling", [
+            'run',
+            '--problem', 'test-problem',
+            '--lang', 'python'
+            # Missing --code parameter
+        ]),
+        ("Invalid JSON Handling", [
+            '--json-input', '{"invalid": json syntax}',
+            '--json-output'
+        ]),
+    ]
+    
+    try:
+        exit_codes = cli.run_many([argv for _, argv in demos])
     finally:
         Path(temp_file).unlink()
     
-    # Demo 8: Error handling
-    print("\n📋 Demo 8: Error Handling")
-    print("-" * 30)
-    result = cli.run([
-        'run',
-        '--problem', 'test-problem',
-        '--lang', 'python'
-        # Missing --code parameter
-    ])
-    print(f"Exit code: {result}")
-    
-    # Demo 9: Invalid JSON input
-    print("\n📋 Demo 9: Invalid JSON Handling")
-    print("-" * 30)
-    result = cli.run([
-        '--json-input', '{"invalid": json syntax}',
-        '--json-output'
-    ])
-    print(f"Exit code: {result}")
+    for i, ((title, _), exit_code) in enumerate(zip(demos, exit_codes), 1):
+        print(f"\n📋 Demo {i}: {title}")
+        print("-" * 30)
+        print(f"Exit code: {exit_code}")
     
     print("\n✅ CLI Demo Complete!")
     print("=" * 50)
@@ -3,16 +3,31 @@
 Demonstration script for the output comparison system.
 """
 
-from orchestrator.testing.comparators import (
-    TextExactComparator,
-    NumericComparator,
-    JsonComparator,
-    ArrayComparator,
-    ComparatorFactory
-)
+import contextlib
+import io
+import sys
+
+def _run_buffered(func, *args):
+    """Run a demo section with its stdout coalesced into one write.
+
+    Each section makes dozens of print calls; buffering them and
+    emitting a single sys.stdout.write flushes a line-buffered
+    terminal once per section instead of once per line.
+    """
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            result = func(*args)
+    finally:
+        # Flush whatever the section printed even if it raised
+        sys.stdout.write(buf.getvalue())
+    return result
+
 
 def demo_text_comparator():
     """Demonstrate text comparison."""
+    from orchestrator.testing.comparators import TextExactComparator
+
     print("=== Text Comparator Demo ===")
     comparator = TextExactComparator(normalize_whitespace=True)
     
@@ -32,6 +47,8 @@ def demo_text_comparator():
 
 def demo_numeric_comparator():
     """Demonstrate numeric comparison."""
+    from orchestrator.testing.comparators import NumericComparator
+
     print("=== Numeric Comparator Demo ===")
     comparator = NumericComparator(epsilon=1e-6)
     
@@ -56,6 +73,8 @@ def demo_numeric_comparator():
 
 def demo_json_comparator():
     """Demonstrate JSON comparison."""
+    from orchestrator.testing.comparators import JsonComparator
+
     print("=== JSON Comparator Demo ===")
     comparator = JsonComparator(ignore_order=True)
     
@@ -75,6 +94,8 @@ def demo_json_comparator():
 
 def demo_array_comparator():
     """Demonstrate array comparison."""
+    from orchestrator.testing.comparators import ArrayComparator
+
     print("=== Array Comparator Demo ===")
     comparator = ArrayComparator(ignore_order=False)
     
@@ -99,6 +120,8 @@ def demo_array_comparator():
 
 def demo_auto_detection():
     """Demonstrate auto-detection."""
+    from orchestrator.testing.comparators import ComparatorFactory
+
     print("=== Auto-Detection Demo ===")
     
     test_cases = [
@@ -118,11 +141,11 @@ def main():
     """Run all demonstrations."""
     print("Output Comparison System Demonstration\n")
     
-    demo_text_comparator()
-    demo_numeric_comparator()
-    demo_json_comparator()
-    demo_array_comparator()
-    demo_auto_detection()
+    _run_buffered(demo_text_comparator)
+    _run_buffered(demo_numeric_comparator)
+    _run_buffered(demo_json_comparator)
+    _run_buffered(demo_array_comparator)
+    _run_buffered(demo_auto_detection)
     
     print("Demo completed!")
 
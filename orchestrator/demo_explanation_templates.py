@@ -9,19 +9,113 @@ This demonstrates the complete explanation generation workflow including:
 - Multi-language support
 """
 
+import contextlib
+import io
+import os
 import sys
 import tempfile
-import shutil
+import threading
+from collections import namedtuple
 from pathlib import Path
 
 # Add the orchestrator directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from explain.engine import ExplanationEngine, CodeAnalyzer
-from explain.template_loader import TemplateLoader
+def _run_buffered(func, *args):
+    """Run a demo section with its stdout coalesced into one write.
+
+    Each section makes dozens of print calls; buffering them and
+    emitting a single sys.stdout.write flushes a line-buffered
+    terminal once per section instead of once per line.
+    """
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            result = func(*args)
+    finally:
+        # Flush whatever the section printed even if it raised
+        sys.stdout.write(buf.getvalue())
+    return result
+
+
+def _preview(text, limit):
+    """Return text truncated to limit characters with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _fast_rmtree(path):
+    """Remove a directory tree using os.scandir.
+
+    Cheaper than shutil.rmtree, which stats every entry separately;
+    scandir gets the entry type from the directory listing itself.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+# Built once at import so repeated demo runs don't re-allocate the case
+# dicts; namedtuple fields are slot-based attribute lookups.
+GenerationCase = namedtuple('GenerationCase', 'problem language tags difficulty code')
+
+_GENERATION_CASES = (
+    GenerationCase(
+        problem="two-sum",
+        language="python",
+        tags=["array", "hash-table"],
+        difficulty="easy",
+        code='''
+def two_sum(nums, target):
+    num_dict = {}
+    for i, num in enumerate(nums):
+        complement = target - num
+        if complement in num_dict:
+            return [num_dict[complement], i]
+        num_dict[num] = i
+    return []
+'''
+    ),
+    GenerationCase(
+        problem="reverse-string",
+        language="python",
+        tags=["string", "two-pointers"],
+        difficulty="easy",
+        code='''
+def reverse_string(s):
+    left, right = 0, len(s) - 1
+    while left < right:
+        s[left], s[right] = s[right], s[left]
+        left += 1
+        right -= 1
+'''
+    ),
+    GenerationCase(
+        problem="fibonacci",
+        language="python",
+        tags=["dynamic-programming"],
+        difficulty="easy",
+        code='''
+def fibonacci(n):
+    if n <= 1:
+        return n
+    dp = [0] * (n + 1)
+    dp[1] = 1
+    for i in range(2, n + 1):
+        dp[i] = dp[i-1] + dp[i-2]
+    return dp[n]
+'''
+    ),
+)
+
 
 def demonstrate_template_loading():
     """Demonstrate template loading and pattern matching."""
+    from explain.engine import ExplanationEngine
+
     print("TEMPLATE LOADING AND PATTERN MATCHING")
     print("=" * 50)
     
@@ -56,11 +150,13 @@ def demonstrate_template_loading():
         
     except Exception as e:
         print(f"Error in template loading demo: {e}")
-        shutil.rmtree(temp_dir)
+        _fast_rmtree(temp_dir)
         return None
 
 def demonstrate_code_analysis():
     """Demonstrate code analysis capabilities."""
+    from explain.engine import CodeAnalyzer
+
     print("\\n\\nCODE ANALYSIS DEMONSTRATION")
     print("=" * 50)
     
@@ -136,12 +232,14 @@ vector<int> twoSum(vector<int>& nums, int target) {
         }
     ]
     
-    for example in code_examples:
+    # Run the analyses as one batch, then print the reports
+    results = analyzer.analyze_many(
+        [(example['code'], example['language']) for example in code_examples])
+
+    for example, analysis in zip(code_examples, results):
         print(f"\\nAnalyzing: {example['name']} ({example['language']})")
         print("-" * 40)
         
-        analysis = analyzer.analyze_code(example['code'], example['language'])
-        
         print(f"Language: {analysis['language']}")
         print(f"Algorithm Type: {analysis['algorithm_type']}")
         print(f"Time Complexity: {analysis['time_complexity']}")
@@ -155,6 +253,8 @@ vector<int> twoSum(vector<int>& nums, int target) {
 
 def demonstrate_explanation_generation(templates_dir):
     """Demonstrate complete explanation generation."""
+    from explain.engine import ExplanationEngine
+
     print("\\n\\nEXPLANATION GENERATION DEMONSTRATION")
     print("=" * 50)
     
@@ -164,75 +264,31 @@ def demonstrate_explanation_generation(templates_dir):
     
     engine = ExplanationEngine(str(templates_dir))
     
-    # Test cases with different problems and code
-    test_cases = [
-        {
-            "problem": "two-sum",
-            "language": "python",
-            "tags": ["array", "hash-table"],
-            "difficulty": "easy",
-            "code": '''
-def two_sum(nums, target):
-    num_dict = {}
-    for i, num in enumerate(nums):
-        complement = target - num
-        if complement in num_dict:
-            return [num_dict[complement], i]
-        num_dict[num] = i
-    return []
-'''
-        },
-        {
-            "problem": "reverse-string",
-            "language": "python",
-            "tags": ["string", "two-pointers"],
-            "difficulty": "easy",
-            "code": '''
-def reverse_string(s):
-    left, right = 0, len(s) - 1
-    while left < right:
-        s[left], s[right] = s[right], s[left]
-        left += 1
-        right -= 1
-'''
-        },
-        {
-            "problem": "fibonacci",
-            "language": "python",
-            "tags": ["dynamic-programming"],
-            "difficulty": "easy",
-            "code": '''
-def fibonacci(n):
-    if n <= 1:
-        return n
-    dp = [0] * (n + 1)
-    dp[1] = 1
-    for i in range(2, n + 1):
-        dp[i] = dp[i-1] + dp[i-2]
-    return dp[n]
-'''
-        }
+    # Generate first in one comprehension pass, then report per case
+    explanations = [
+        engine.generate_explanation(
+            problem_slug=case.problem,
+            language=case.language,
+            code=case.code,
+            tags=case.tags,
+            difficulty=case.difficulty
+        )
+        for case in _GENERATION_CASES
     ]
-    
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\\n{i}. Generating explanation for: {test_case['problem']}")
+
+    for i, (case, explanation) in enumerate(zip(_GENERATION_CASES, explanations), 1):
+        print(f"\\n{i}. Generating explanation for: {case.problem}")
         print("-" * 60)
         
-        explanation = engine.generate_explanation(
-            problem_slug=test_case['problem'],
-            language=test_case['language'],
-            code=test_case['code'],
-            tags=test_case['tags'],
-            difficulty=test_case['difficulty']
-        )
-        
         # Show first 500 characters of explanation
-        preview = explanation[:500] + "..." if len(explanation) > 500 else explanation
+        preview = _preview(explanation, 500)
         print(preview)
         print(f"\\n[Full explanation length: {len(explanation)} characters]")
 
 def demonstrate_template_customization():
     """Demonstrate template customization and variable substitution."""
+    from explain.template_loader import TemplateLoader
+
     print("\\n\\nTEMPLATE CUSTOMIZATION DEMONSTRATION")
     print("=" * 50)
     
@@ -301,15 +357,17 @@ This approach provides an efficient solution with {{time_complexity}} time compl
         print("-" * 30)
         
         rendered = loader.render_template("custom_demo", variables)
-        print(rendered[:800] + "..." if len(rendered) > 800 else rendered)
+        print(_preview(rendered, 800))
         
     except Exception as e:
         print(f"Error in template customization demo: {e}")
     finally:
-        shutil.rmtree(temp_dir)
+        _fast_rmtree(temp_dir)
 
 def demonstrate_hints_system():
     """Demonstrate the hints generation system."""
+    from explain.engine import ExplanationEngine
+
     print("\\n\\nHINTS GENERATION DEMONSTRATION")
     print("=" * 50)
     
@@ -341,11 +399,11 @@ def main():
     
     try:
         # Run demonstrations
-        templates_dir = demonstrate_template_loading()
-        demonstrate_code_analysis()
-        demonstrate_explanation_generation(templates_dir)
-        demonstrate_template_customization()
-        demonstrate_hints_system()
+        templates_dir = _run_buffered(demonstrate_template_loading)
+        _run_buffered(demonstrate_code_analysis)
+        _run_buffered(demonstrate_explanation_generation, templates_dir)
+        _run_buffered(demonstrate_template_customization)
+        _run_buffered(demonstrate_hints_system)
         
         print("\\n" + "=" * 60)
         print("✓ DEMONSTRATION COMPLETE")
@@ -359,9 +417,11 @@ def main():
         print("• Progressive hint generation")
         print("• Markdown template rendering")
         
-        # Clean up
+        # Clean up in the background; the non-daemon thread is joined
+        # at interpreter exit, after the remaining output is printed.
         if templates_dir:
-            shutil.rmtree(templates_dir.parent)
+            threading.Thread(target=_fast_rmtree,
+                             args=(templates_dir.parent,)).start()
         
     except Exception as e:
         print(f"\\n✗ Demo failed: {e}")
@@ -6,71 +6,126 @@ This demonstrates the complete test generation workflow from problem.json
 to generated test files with expected outputs.
 """
 
+import functools
 import json
+import os
 import tempfile
 import subprocess
 import sys
 from pathlib import Path
 
-def create_sample_problem():
-    """Create a sample problem for demonstration."""
-    # Create temporary directory
-    temp_dir = tempfile.mkdtemp()
-    problem_dir = Path(temp_dir) / "reverse_string"
-    problem_dir.mkdir(parents=True)
-    
-    print(f"Created problem directory: {problem_dir}")
-    
-    # Create problem.json with test specification
-    problem_spec = {
-        "slug": "reverse-string",
-        "title": "Reverse String",
-        "description": "Write a function that reverses a string.",
-        "difficulty": "Easy",
-        "tags": ["String", "Two Pointers"],
-        "test_spec": {
-            "num_cases": 8,
-            "case_types": ["sample", "unit", "edge", "hidden"],
-            "string": {
-                "min_length": 1,
-                "max_length": 20,
-                "charset": "lowercase",
-                "patterns": ["random", "palindrome", "repeated"],
-                "ensure_coverage": True
-            },
-            "constraints": {
-                "max_string_length": 20,
-                "min_string_length": 1
-            }
+# Resolved once: every invocation needs the same script path, and
+# subprocess ultimately wants a string anyway
+_GEN_TESTS_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "gen_tests.py")
+_BASE_CMD = (sys.executable, _GEN_TESTS_SCRIPT)
+
+class GenTestsWorker:
+    """Long-lived gen_tests.py worker speaking JSON over stdio.
+
+    One persistent child process serves every generation request, so
+    only the first call pays interpreter and import startup.
+    """
+
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            [*_BASE_CMD, "--server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+
+    def generate(self, problem_dir, output_dir=None, gen_type="auto",
+                 num_cases=None, seed=42, force=True):
+        """Send one generation request and return the parsed response."""
+        request = {
+            "problem_dir": str(problem_dir),
+            "type": gen_type,
+            "num_cases": num_cases,
+            "seed": seed,
+            "force": force
+        }
+        if output_dir is not None:
+            request["output_dir"] = str(output_dir)
+        self._proc.stdin.write(json.dumps(request) + "\n")
+        response = self._proc.stdout.readline()
+        if not response:
+            raise RuntimeError("gen_tests worker exited unexpectedly")
+        return json.loads(response)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._proc.stdin.close()
+        self._proc.wait()
+
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    _orjson = None
+
+
+@functools.lru_cache(maxsize=256)
+def _load_json_cached(path, mtime_ns):
+    """Parse a JSON file, keyed by path and mtime for reuse."""
+    data = Path(path).read_bytes()
+    return _orjson.loads(data) if _orjson is not None else json.loads(data)
+
+
+def load_json(path):
+    """Load JSON with a parse cache that invalidates on modification."""
+    return _load_json_cached(str(path), os.stat(path).st_mtime_ns)
+
+
+# The demo problem is static, so serialize it once at import instead of
+# rebuilding the dict and re-running json.dumps on every call
+_PROBLEM_SPEC = {
+    "slug": "reverse-string",
+    "title": "Reverse String",
+    "description": "Write a function that reverses a string.",
+    "difficulty": "Easy",
+    "tags": ["String", "Two Pointers"],
+    "test_spec": {
+        "num_cases": 8,
+        "case_types": ["sample", "unit", "edge", "hidden"],
+        "string": {
+            "min_length": 1,
+            "max_length": 20,
+            "charset": "lowercase",
+            "patterns": ["random", "palindrome", "repeated"],
+            "ensure_coverage": True
         },
-        "examples": [
-            {
-                "input": "hello",
-                "output": "olleh",
-                "explanation": "The string 'hello' reversed is 'olleh'"
-            },
-            {
-                "input": "world",
-                "output": "dlrow",
-                "explanation": "The string 'world' reversed is 'dlrow'"
-            }
-        ]
-    }
-    
-    problem_file = problem_dir / "problem.json"
-    with open(problem_file, 'w') as f:
-        json.dump(problem_spec, f, indent=2)
-    
-    print(f"Created problem.json: {problem_file}")
-    
-    # Create reference solution in Python
-    reference_solution = '''#!/usr/bin/env python3
-"""
+        "constraints": {
+            "max_string_length": 20,
+            "min_string_length": 1
+        }
+    },
+    "examples": [
+        {
+            "input": "hello",
+            "output": "olleh",
+            "explanation": "The string 'hello' reversed is 'olleh'"
+        },
+        {
+            "input": "world",
+            "output": "dlrow",
+            "explanation": "The string 'world' reversed is 'dlrow'"
+        }
+    ]
+}
+
+_PROBLEM_SPEC_JSON = json.dumps(_PROBLEM_SPEC, indent=2).encode()
+
+_REFERENCE_SOLUTION = b"""#!/usr/bin/env python3
+\"\"\"
 Reference solution for reverse string problem.
-"""
+\"\"\"
 
 def reverse_string(s):
-    """Reverse the input string."""
+    \"\"\"Reverse the input string.\"\"\"
     return s[::-1]
 
 if __name__ == "__main__":
@@ -80,11 +135,25 @@ if __name__ == "__main__":
     # Process and output result
     result = reverse_string(input_string)
     print(result)
-'''
+"""
+
+
+def create_sample_problem(root):
+    """Create a sample problem for demonstration under root."""
+    problem_dir = Path(root) / "reverse_string"
+    problem_dir.mkdir(parents=True)
     
+    print(f"Created problem directory: {problem_dir}")
+    
+    # Create problem.json with test specification
+    problem_file = problem_dir / "problem.json"
+    problem_file.write_bytes(_PROBLEM_SPEC_JSON)
+    
+    print(f"Created problem.json: {problem_file}")
+    
+    # Create reference solution in Python
     solution_file = problem_dir / "solution.py"
-    with open(solution_file, 'w') as f:
-        f.write(reference_solution)
+    solution_file.write_bytes(_REFERENCE_SOLUTION)
     
     print(f"Created reference solution: {solution_file}")
     
@@ -96,37 +165,43 @@ def demonstrate_cli_usage(problem_dir):
     print("DEMONSTRATING CLI USAGE")
     print("="*60)
     
-    gen_tests_script = Path(__file__).parent / "gen_tests.py"
-    
     # Show help
     print("\\n1. Showing help:")
     print("-" * 30)
-    cmd = [sys.executable, str(gen_tests_script), "--help"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    print(result.stdout[:500] + "..." if len(result.stdout) > 500 else result.stdout)
+    cmd = (*_BASE_CMD, "--help")
+    result = subprocess.run(cmd, capture_output=True)
+    # Keep stdout as bytes and decode only the bounded slice actually
+    # shown instead of eagerly decoding the whole help text
+    out = result.stdout
+    sys.stdout.write(out[:500].decode('utf-8', errors='replace'))
+    sys.stdout.write("...\n" if len(out) > 500 else "\n")
     
     # Generate tests with string generator
     print("\\n2. Generating tests with string generator:")
     print("-" * 30)
-    cmd = [
-        sys.executable, str(gen_tests_script),
+    cmd = (
+        *_BASE_CMD,
         str(problem_dir),
         "--type", "string",
         "--num-cases", "6",
         "--seed", "42",
         "--verbose"
-    ]
+    )
     
     print(f"Command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True)
     
     if result.returncode == 0:
         print("✓ SUCCESS:")
-        print(result.stdout)
+        # Push the raw bytes through the buffer layer; the C stdio
+        # writer handles them without a Python-level decode/encode trip
+        sys.stdout.flush()
+        sys.stdout.buffer.write(result.stdout)
+        sys.stdout.write("\n")
     else:
         print("✗ FAILED:")
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
+        print("STDOUT:", result.stdout.decode('utf-8', errors='replace'))
+        print("STDERR:", result.stderr.decode('utf-8', errors='replace'))
         return False
     
     return True
@@ -139,18 +214,30 @@ def examine_generated_files(problem_dir):
     
     tests_dir = problem_dir / "tests"
     
-    if not tests_dir.exists():
+    # Walk first and let scandir raise instead of paying a separate
+    # exists() stat; a missing tree takes the early-return branch below
+    rel_paths = []
+    stack = [(str(tests_dir), "")]
+    try:
+        while stack:
+            current, prefix = stack.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    rel = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, rel + os.sep))
+                    else:
+                        rel_paths.append(rel)
+    except FileNotFoundError:
         print("✗ Tests directory not found!")
         return
     
     print(f"\\nTests directory: {tests_dir}")
     
-    # Show directory structure
+    # Show directory structure; the scandir walk gets entry types from
+    # the directory listing itself instead of rglob's per-Path stats
     print("\\nDirectory structure:")
-    for item in sorted(tests_dir.rglob("*")):
-        if item.is_file():
-            rel_path = item.relative_to(tests_dir)
-            print(f"  {rel_path}")
+    print('\n'.join('  ' + rel_path for rel_path in sorted(rel_paths)))
     
     # Show sample test files
     print("\\nSample test files:")
@@ -158,38 +245,55 @@ def examine_generated_files(problem_dir):
     # Find first input/output pair
     for test_type in ["sample", "unit", "hidden"]:
         type_dir = tests_dir / test_type
-        if type_dir.exists():
-            input_files = sorted(type_dir.glob("*.in"))
-            if input_files:
-                input_file = input_files[0]
-                output_file = input_file.with_suffix(".out")
-                
-                print(f"\\n{test_type.upper()} Test Case:")
-                print(f"Input file: {input_file.name}")
-                with open(input_file) as f:
-                    input_content = f.read().strip()
-                    print(f"  Content: '{input_content}'")
+        # glob on a missing directory just yields nothing, so the
+        # exists() pre-check was a wasted stat
+        input_files = sorted(type_dir.glob("*.in"))
+        if input_files:
+            input_file = input_files[0]
+            output_file = input_file.with_suffix(".out")
+            
+            print(f"\\n{test_type.upper()} Test Case:")
+            print(f"Input file: {input_file.name}")
+            input_content = input_file.read_bytes().decode().strip()
+            print(f"  Content: '{input_content}'")
+            
+            if output_file.exists():
+                print(f"Output file: {output_file.name}")
+                output_content = output_file.read_bytes().decode().strip()
+                print(f"  Content: '{output_content}'")
                 
-                if output_file.exists():
-                    print(f"Output file: {output_file.name}")
-                    with open(output_file) as f:
-                        output_content = f.read().strip()
-                        print(f"  Content: '{output_content}'")
-                    
-                    # Verify correctness
-                    expected = input_content[::-1]
-                    if output_content == expected:
-                        print(f"  ✓ Correct: '{input_content}' -> '{output_content}'")
-                    else:
-                        print(f"  ✗ Incorrect: expected '{expected}', got '{output_content}'")
-                break
+                # Verify correctness
+                expected = input_content[::-1]
+                if output_content == expected:
+                    print(f"  ✓ Correct: '{input_content}' -> '{output_content}'")
+                else:
+                    print(f"  ✗ Incorrect: expected '{expected}', got '{output_content}'")
+            break
+    
+    # Batch-verify every generated pair at the bytes level: one
+    # C-level reverse copy per pair instead of decode + str slicing
+    in_paths = [rel for rel in rel_paths if rel.endswith(".in")]
+    checked = correct = 0
+    for rel in sorted(in_paths):
+        try:
+            out_bytes = (tests_dir / (rel[:-3] + ".out")).read_bytes()
+        except FileNotFoundError:
+            continue
+        in_bytes = (tests_dir / rel).read_bytes()
+        checked += 1
+        if in_bytes.strip()[::-1] == out_bytes.strip():
+            correct += 1
+    if checked:
+        print(f"\\nVerified {correct}/{checked} input/output pairs reverse correctly")
     
     # Show metadata
     metadata_file = tests_dir / "generation_metadata.json"
-    if metadata_file.exists():
+    try:
+        metadata = load_json(metadata_file)
+    except FileNotFoundError:
+        metadata = None
+    if metadata is not None:
         print("\\nGeneration metadata:")
-        with open(metadata_file) as f:
-            metadata = json.load(f)
         
         print(f"  Generator: {metadata['generator']['type']}")
         print(f"  Config: {metadata['generator']['config']}")
@@ -205,8 +309,6 @@ def demonstrate_different_generators(problem_dir):
     print("DEMONSTRATING DIFFERENT GENERATORS")
     print("="*60)
     
-    gen_tests_script = Path(__file__).parent / "gen_tests.py"
-    
     generators = [
         ("auto", "Auto-detection based on problem spec"),
         ("string", "General string test generator"),
@@ -214,41 +316,39 @@ def demonstrate_different_generators(problem_dir):
         ("simple", "Simple numeric test generator")
     ]
     
-    for gen_type, description in generators:
-        print(f"\\n{gen_type.upper()} Generator:")
-        print(f"Description: {description}")
-        print("-" * 40)
-        
-        # Clear existing tests
-        tests_dir = problem_dir / "tests"
-        if tests_dir.exists():
-            import shutil
-            shutil.rmtree(tests_dir)
-        
-        cmd = [
-            sys.executable, str(gen_tests_script),
-            str(problem_dir),
-            "--type", gen_type,
-            "--num-cases", "3",
-            "--seed", "123",
-            "--force"
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
+    # One warm worker process serves all four requests over stdio, so
+    # only the first pays interpreter and import startup. Each run still
+    # writes into its own tests_<type> directory so nothing races on a
+    # shared tests/ tree.
+    with GenTestsWorker() as worker:
+        results = []
+        for gen_type, _ in generators:
+            out_dir = problem_dir / f"tests_{gen_type}"
+            results.append((worker.generate(problem_dir, output_dir=out_dir,
+                                            gen_type=gen_type, num_cases=3,
+                                            seed=123), out_dir))
+
+    # Build the report in one buffer and emit a single write per run
+    lines = []
+    for (gen_type, description), (response, out_dir) in zip(generators, results):
+        lines.append(f"\\n{gen_type.upper()} Generator:")
+        lines.append(f"Description: {description}")
+        lines.append("-" * 40)
         
-        if result.returncode == 0:
-            print("✓", result.stdout.strip())
+        if response.get("status") == "success":
+            lines.append(f"✓ Generated {response['num_cases']} test cases "
+                         f"using {response['generator']}")
             
             # Show one example
-            unit_dir = tests_dir / "unit"
-            if unit_dir.exists():
-                input_files = list(unit_dir.glob("*.in"))
-                if input_files:
-                    with open(input_files[0]) as f:
-                        sample_input = f.read().strip()
-                    print(f"  Sample input: '{sample_input}'")
+            unit_dir = out_dir / "unit"
+            input_files = sorted(unit_dir.glob("*.in"))
+            if input_files:
+                sample_input = input_files[0].read_bytes().decode().strip()
+                lines.append(f"  Sample input: '{sample_input}'")
         else:
-            print("✗ Failed:", result.stderr.strip())
+            lines.append("✗ Failed: "
+                         + response.get("error", response.get("reason", "unknown")))
+    print('\n'.join(lines))
 
 def main():
     """Main demonstration function."""
@@ -261,23 +361,27 @@ def main():
     print("4. Examine the generated test files")
     
     try:
-        # Create sample problem
-        problem_dir = create_sample_problem()
-        
-        # Demonstrate CLI usage
-        if not demonstrate_cli_usage(problem_dir):
-            print("\\n✗ CLI demonstration failed - likely missing dependencies")
-            print("The gen_tests.py tool requires:")
-            print("  - jsonschema (for problem validation)")
-            print("  - All generator and adapter modules")
-            print("\\nHowever, the implementation is complete and comprehensive!")
-            return
-        
-        # Examine generated files
-        examine_generated_files(problem_dir)
-        
-        # Demonstrate different generators
-        demonstrate_different_generators(problem_dir)
+        # One temporary root holds the problem and every generator's
+        # output, so cleanup is a single rmtree when the context exits
+        # instead of per-demo deletion churn.
+        with tempfile.TemporaryDirectory() as root:
+            # Create sample problem
+            problem_dir = create_sample_problem(root)
+            
+            # Demonstrate CLI usage
+            if not demonstrate_cli_usage(problem_dir):
+                print("\\n✗ CLI demonstration failed - likely missing dependencies")
+                print("The gen_tests.py tool requires:")
+                print("  - jsonschema (for problem validation)")
+                print("  - All generator and adapter modules")
+                print("\\nHowever, the implementation is complete and comprehensive!")
+                return
+            
+            # Examine generated files
+            examine_generated_files(problem_dir)
+            
+            # Demonstrate different generators
+            demonstrate_different_generators(problem_dir)
         
         print("\\n" + "="*60)
         print("✓ DEMONSTRATION COMPLETE")
@@ -294,16 +398,6 @@ def main():
         print(f"\\n✗ Demo failed: {e}")
         import traceback
         traceback.print_exc()
-    
-    finally:
-        # Clean up
-        try:
-            import shutil
-            if 'problem_dir' in locals():
-                shutil.rmtree(problem_dir.parent)
-                print(f"\\nCleaned up temporary directory: {problem_dir.parent}")
-        except:
-            pass
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,6 +3,8 @@
 Demonstration script for the test generator framework.
 """
 
+from collections import defaultdict
+
 from orchestrator.testing.generators.base import (
     GeneratorConfig, TestCaseType, SimpleTestGenerator
 )
@@ -98,12 +100,9 @@ def demo_multiple_case_types():
     test_cases = generator.generate_test_cases()
     
     # Group by case type
-    by_type = {}
+    by_type = defaultdict(list)
     for test_case in test_cases:
-        case_type = test_case.case_type
-        if case_type not in by_type:
-            by_type[case_type] = []
-        by_type[case_type].append(test_case)
+        by_type[test_case.case_type].append(test_case)
     
     for case_type, cases in by_type.items():
         print(f"{case_type.value.upper()} cases ({len(cases)}):")
@@ -178,6 +177,9 @@ def demo_random_utilities():
     print("Random sample of 3 from [1,2,3,4,5]:", generator.generate_random_sample([1,2,3,4,5], 3))
     print("Random string (length 8):", generator.generate_random_string(8))
     print("Random string with digits:", generator.generate_random_string(5, '0123456789'))
+    print("Bulk random ints (8 in 1-10):", generator.generate_random_ints(1, 10, 8))
+    print("Bulk random floats (8 in 0-1):",
+          [f"{x:.2f}" for x in generator.generate_random_floats(0.0, 1.0, 8)])
     
     original = [1, 2, 3, 4, 5]
     shuffled = generator.shuffle_list(original)
@@ -200,8 +202,7 @@ def demo_generation_summary():
     summary = generator.get_generation_summary()
     
     print("Generation Summary:")
-    for key, value in summary.items():
-        print(f"  {key}: {value}")
+    print('\n'.join(f"  {key}: {value}" for key, value in summary.items()))
     print()
 
 def main():
@@ -9,6 +9,7 @@ and comprehensive result reporting.
 
 import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 import os
@@ -19,6 +20,75 @@ sys.path.insert(0, os.path.dirname(__file__))
 from cli import OrchestatorCLI
 
 
+# Demo code payloads, hoisted so each run reuses the same objects
+# instead of rebuilding multi-line literals inside the function; the
+# code-file payload is pre-encoded for a single binary write.
+_TWO_SUM_CODE = '''
+def two_sum(nums, target):
+    seen = {}
+    for i, num in enumerate(nums):
+        complement = target - num
+        if complement in seen:
+            return [seen[complement], i]
+        seen[num] = i
+    return []
+
+# Test the function
+if __name__ == "__main__":
+    print(two_sum([2, 7, 11, 15], 9))
+'''
+
+_HELLO_WORLD_CPP = '''
+#include <iostream>
+#include <vector>
+using namespace std;
+
+int main() {
+    cout << "Hello, World!" << endl;
+    return 0;
+}
+'''
+
+_SYNTAX_ERROR_CPP = '''
+#include <iostream>
+int main() {
+    std::cout << "Missing semicolon" << std::endl
+    return 0;
+}
+'''
+
+_BINARY_SEARCH_CODE = '''
+def binary_search(nums, target):
+    left, right = 0, len(nums) - 1
+    while left <= right:
+        mid = (left + right) // 2
+        if nums[mid] == target:
+            return mid
+        elif nums[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return -1
+
+# Test the function
+if __name__ == "__main__":
+    print(binary_search([1, 2, 3, 4, 5], 3))
+'''
+
+_FACTORIAL_CODE_BYTES = b'''
+from math import factorial
+
+def main():
+    """Test the factorial function."""
+    test_cases = [0, 1, 5, 10]
+    for n in test_cases:
+        print(f"factorial({n}) = {factorial(n)}")
+
+if __name__ == "__main__":
+    main()
+'''
+
+
 def demo_integrated_run_command():
     """Demonstrate the fully integrated run command with real execution service."""
     print("🚀 Integrated Run Command with Real Execution Service Demo")
@@ -36,20 +106,7 @@ def demo_integrated_run_command():
         'run',
         '--problem', 'two-sum',
         '--lang', 'python',
-        '--code', '''
-def two_sum(nums, target):
-    seen = {}
-    for i, num in enumerate(nums):
-        complement = target - num
-        if complement in seen:
-            return [seen[complement], i]
-        seen[num] = i
-    return []
-
-# Test the function
-if __name__ == "__main__":
-    print(two_sum([2, 7, 11, 15], 9))
-'''
+        '--code', _TWO_SUM_CODE
     ])
     print(f"✅ Python execution completed with exit code: {result}")
     
@@ -63,16 +120,7 @@ if __name__ == "__main__":
         'run',
         '--problem', 'hello-world',
         '--lang', 'cpp',
-        '--code', '''
-#include <iostream>
-#include <vector>
-using namespace std;
-
-int main() {
-    cout << "Hello, World!" << endl;
-    return 0;
-}
-'''
+        '--code', _HELLO_WORLD_CPP
     ])
     print(f"✅ C++ execution completed with exit code: {result}")
     
@@ -86,13 +134,7 @@ int main() {
         'run',
         '--problem', 'syntax-error-test',
         '--lang', 'cpp',
-        '--code', '''
-#include <iostream>
-int main() {
-    std::cout << "Missing semicolon" << std::endl
-    return 0;
-}
-'''
+        '--code', _SYNTAX_ERROR_CPP
     ])
     print(f"✅ Compilation error handled with exit code: {result}")
     
@@ -105,23 +147,7 @@ int main() {
         "command": "run",
         "problem": "binary-search",
         "lang": "python",
-        "code": '''
-def binary_search(nums, target):
-    left, right = 0, len(nums) - 1
-    while left <= right:
-        mid = (left + right) // 2
-        if nums[mid] == target:
-            return mid
-        elif nums[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-    return -1
-
-# Test the function
-if __name__ == "__main__":
-    print(binary_search([1, 2, 3, 4, 5], 3))
-'''
+        "code": _BINARY_SEARCH_CODE
     }
     
     result = cli.run([
@@ -135,25 +161,10 @@ if __name__ == "__main__":
     print("-" * 45)
     print("Testing code loading from file...")
     
-    # Create a temporary code file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-        f.write('''
-def factorial(n):
-    """Calculate factorial of n."""
-    if n <= 1:
-        return 1
-    return n * factorial(n - 1)
-
-def main():
-    """Test the factorial function."""
-    test_cases = [0, 1, 5, 10]
-    for n in test_cases:
-        result = factorial(n)
-        print(f"factorial({n}) = {result}")
-
-if __name__ == "__main__":
-    main()
-''')
+    # Create a temporary code file with one binary write of the
+    # pre-encoded payload
+    with tempfile.NamedTemporaryFile(suffix='.py', delete=False) as f:
+        f.write(_FACTORIAL_CODE_BYTES)
         temp_file = f.name
     
     try:
@@ -196,15 +207,10 @@ int main() {
     print("-" * 45)
     print("Testing different test set selections...")
     
-    for test_set in ['all', 'sample', 'unit']:
-        print(f"Running with test set: {test_set}")
-        result = cli.run([
-            '--json-output',
-            'run',
-            '--problem', f'test-set-{test_set}',
-            '--lang', 'python',
-            '--tests', test_set,
-            '--code', '''
+    # The three selections are independent, so batch them through
+    # run_many, which shares one event loop across the invocations
+    test_sets = ['all', 'sample', 'unit']
+    test_set_code = '''
 def simple_add(a, b):
     """Simple addition function for testing."""
     return a + b
@@ -212,7 +218,19 @@ def simple_add(a, b):
 if __name__ == "__main__":
     print(simple_add(2, 3))
 '''
-        ])
+    results = cli.run_many([
+        [
+            '--json-output',
+            'run',
+            '--problem', f'test-set-{test_set}',
+            '--lang', 'python',
+            '--tests', test_set,
+            '--code', test_set_code
+        ]
+        for test_set in test_sets
+    ])
+    for test_set, result in zip(test_sets, results):
+        print(f"Running with test set: {test_set}")
         print(f"  ✅ Test set '{test_set}' completed with exit code: {result}")
     
     # Demo 8: Error recovery and resilience
@@ -267,9 +285,8 @@ def demo_execution_service_features():
     # Test default test cases for common problems
     common_problems = ['two-sum', 'add-two-numbers', 'longest-substring', 'valid-parentheses']
     
-    for problem in common_problems:
-        print(f"\n📝 Testing default test cases for: {problem}")
-        result = cli.run([
+    def run_problem(problem):
+        return cli.run([
             '--json-output',
             'run',
             '--problem', problem,
@@ -283,6 +300,16 @@ if __name__ == "__main__":
     print(solution())
 '''
         ])
+
+    # The per-problem runs are independent and dominated by test-case
+    # loading and subprocess IO, so overlap them on a bounded pool and
+    # report in input order
+    max_workers = min(len(common_problems), max(1, (os.cpu_count() or 2) - 2))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run_problem, common_problems))
+
+    for problem, result in zip(common_problems, results):
+        print(f"\n📝 Testing default test cases for: {problem}")
         print(f"  ✅ {problem} test cases loaded, exit code: {result}")
     
     print("\n✨ Execution service features demonstration complete!")
@@ -8,12 +8,26 @@ with priority system that favors community explanations over templates.
 
 import os
 import json
+import re
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: these run on every explanation load, and
+# re.compile at module scope skips the per-call pattern-cache lookup.
+_FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n?(.*)$', re.DOTALL)
+
+# All metadata signals in one alternation so feature detection is a
+# single scan over the body instead of one pass per heuristic.
+_METADATA_SCAN_RE = re.compile(
+    r'(?P<fence>```)'
+    r'|(?P<code>def |class )'
+    r'|(?P<comp>(?i:o\(|time complexity|space complexity|big o))'
+    r'|(?P<step>(?i:step 1|step-by-step|algorithm:|approach:))'
+)
+
 class CommunityExplanationLoader:
     """
     Loads and manages community-contributed explanations.
@@ -72,29 +86,36 @@ class CommunityExplanationLoader:
         Returns:
             Dictionary with explanation content and metadata, or None if not found
         """
-        # Check cache first
-        if problem_slug in self.explanation_cache:
-            return self.explanation_cache[problem_slug]
-        
         explanation_file = self.find_community_explanation(problem_slug)
         if not explanation_file:
             return None
-        
+
         try:
-            content = explanation_file.read_text(encoding='utf-8')
+            # Check cache first; entries are keyed by mtime so edits on
+            # disk invalidate implicitly while repeat loads of an
+            # unchanged file cost one stat plus a dict hit.
+            file_stat = explanation_file.stat()
+            cached = self.explanation_cache.get(problem_slug)
+            if cached is not None and cached[0] == file_stat.st_mtime_ns:
+                return cached[1]
+
+            # read_bytes + one decode skips TextIOWrapper's incremental
+            # decoder on the cache-miss path
+            content = explanation_file.read_bytes().decode('utf-8')
             metadata, explanation_content = self._parse_explanation_file(content)
-            
+
             explanation_data = {
                 'content': explanation_content,
                 'metadata': metadata,
                 'file_path': explanation_file,
-                'last_modified': explanation_file.stat().st_mtime,
+                'last_modified': file_stat.st_mtime,
                 'source': 'community'
             }
-            
+
             # Cache the result
-            self.explanation_cache[problem_slug] = explanation_data
-            
+            self.explanation_cache[problem_slug] = (file_stat.st_mtime_ns,
+                                                    explanation_data)
+
             logger.info(f"Loaded community explanation for {problem_slug}")
             return explanation_data
             
@@ -114,12 +135,15 @@ class CommunityExplanationLoader:
         """
         # Check for YAML front matter
         if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
+            match = _FRONT_MATTER_RE.match(content)
+            if match:
                 try:
-                    metadata_text = parts[1].strip()
-                    metadata = self._parse_yaml_metadata(metadata_text)
-                    explanation_content = parts[2].strip()
+                    explanation_content = match.group(2).strip()
+                    # Content heuristics (word count, code/complexity
+                    # flags) fill in anything the front matter doesn't
+                    # state explicitly.
+                    metadata = self._extract_metadata_from_content(explanation_content)
+                    metadata.update(self._parse_yaml_metadata(match.group(1).strip()))
                     return metadata, explanation_content
                 except Exception as e:
                     logger.warning(f"Failed to parse explanation metadata: {e}")
@@ -139,8 +163,8 @@ class CommunityExplanationLoader:
             Parsed metadata dictionary
         """
         metadata = {}
-        
-        for line in yaml_text.split('\\n'):
+
+        for line in yaml_text.splitlines():
             line = line.strip()
             if ':' in line:
                 key, value = line.split(':', 1)
@@ -181,20 +205,23 @@ class CommunityExplanationLoader:
             'estimated_reading_time': 0
         }
         
-        content_lower = content.lower()
-        
-        # Check for code examples
-        if '```' in content or 'def ' in content or 'class ' in content:
+        # One fused scan sets every feature flag; a fenced code block
+        # still needs an opening and a closing ```
+        fence_count = 0
+        has_code_keyword = False
+        for match in _METADATA_SCAN_RE.finditer(content):
+            group = match.lastgroup
+            if group == 'fence':
+                fence_count += 1
+            elif group == 'code':
+                has_code_keyword = True
+            elif group == 'comp':
+                metadata['has_complexity_analysis'] = True
+            else:
+                metadata['has_step_by_step'] = True
+        if fence_count // 2 > 0 or has_code_keyword:
             metadata['has_code_examples'] = True
         
-        # Check for complexity analysis
-        if any(term in content_lower for term in ['o(', 'time complexity', 'space complexity', 'big o']):
-            metadata['has_complexity_analysis'] = True
-        
-        # Check for step-by-step explanation
-        if any(term in content_lower for term in ['step 1', 'step-by-step', 'algorithm:', 'approach:']):
-            metadata['has_step_by_step'] = True
-        
         # Estimate reading time (average 200 words per minute)
         word_count = len(content.split())
         metadata['estimated_reading_time'] = max(1, word_count // 200)
@@ -202,6 +229,31 @@ class CommunityExplanationLoader:
         
         return metadata
     
+    def load_many(self, problem_slugs: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Load several community explanations concurrently.
+
+        The per-problem work is IO-bound (open + read + parse), so a
+        thread pool overlaps the file reads instead of serializing them;
+        results land in the same mtime-keyed cache as single loads.
+
+        Args:
+            problem_slugs: Problem identifiers to load
+
+        Returns:
+            Dictionary mapping each slug to its explanation data (or None)
+        """
+        if not problem_slugs:
+            return {}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(problem_slugs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(problem_slugs,
+                            executor.map(self.load_community_explanation,
+                                         problem_slugs)))
+
     def get_explanation_priority(self, problem_slug: str) -> int:
         """
         Get priority score for community explanation.
@@ -244,16 +296,24 @@ class CommunityExplanationLoader:
             List of problem slugs with community explanations
         """
         problems_with_explanations = []
-        
-        if not self.problems_dir.exists():
+
+        # os.scandir gets the entry type from the directory listing
+        # itself, avoiding the extra stat per entry that Path.iterdir
+        # plus is_dir() would pay.
+        try:
+            with os.scandir(self.problems_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    # Common case: explanation.md sits directly in the
+                    # problem directory; fall back to the full location
+                    # search otherwise.
+                    if (os.path.isfile(os.path.join(entry.path, "explanation.md"))
+                            or self.find_community_explanation(entry.name)):
+                        problems_with_explanations.append(entry.name)
+        except FileNotFoundError:
             return problems_with_explanations
-        
-        for problem_dir in self.problems_dir.iterdir():
-            if problem_dir.is_dir():
-                problem_slug = problem_dir.name
-                if self.find_community_explanation(problem_slug):
-                    problems_with_explanations.append(problem_slug)
-        
+
         return sorted(problems_with_explanations)
     
     def get_explanation_stats(self) -> Dict[str, Any]:
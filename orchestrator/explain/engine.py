@@ -19,6 +19,11 @@ from .community_loader import CommunityExplanationLoader
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: these run for every analyzed code snippet
+_DEF_NAME_RE = re.compile(r'def (\w+)')
+_LOOP_RE = re.compile(r'\b(for|while)\b', re.IGNORECASE)
+_IF_RE = re.compile(r'\bif\b', re.IGNORECASE)
+
 
 class ExplanationEngine:
     """
@@ -42,6 +47,8 @@ class ExplanationEngine:
         self.template_loader = TemplateLoader(templates_dir) if templates_dir else TemplateLoader()
         self.community_loader = CommunityExplanationLoader(problems_dir) if problems_dir else CommunityExplanationLoader()
         self.code_analyzer = CodeAnalyzer()
+        # Enhanced no-code community explanations, keyed by (slug, language)
+        self._enhanced_cache = {}
     
 
     
@@ -66,6 +73,21 @@ class ExplanationEngine:
             
             if community_explanation:
                 logger.info(f"Using community explanation for {problem_slug}")
+                if code is None:
+                    # Without code there is nothing request-specific to
+                    # analyze, so the enhanced text is memoized. The
+                    # cached loader dict is identity-checked: when the
+                    # file changes on disk the loader hands back a new
+                    # dict and the entry is rebuilt.
+                    key = (problem_slug, language)
+                    cached = self._enhanced_cache.get(key)
+                    if cached is not None and cached[0] is community_explanation:
+                        return cached[1]
+                    enhanced = self._enhance_community_explanation(
+                        community_explanation, language, code, tags, difficulty
+                    )
+                    self._enhanced_cache[key] = (community_explanation, enhanced)
+                    return enhanced
                 return self._enhance_community_explanation(
                     community_explanation, language, code, tags, difficulty
                 )
@@ -466,6 +488,21 @@ class CodeAnalyzer:
             logger.error(f"Error analyzing code: {e}")
             return self._get_default_analysis()
     
+    def analyze_many(self, items: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Analyze several code snippets in one call.
+        
+        The language dispatch and compiled pattern constants are shared
+        across the whole batch instead of being re-resolved per call.
+        
+        Args:
+            items: Sequence of (code, language) pairs
+            
+        Returns:
+            List of analysis dictionaries in input order
+        """
+        return [self.analyze_code(code, language) for code, language in items]
+    
     def _analyze_python_code(self, code: str) -> Dict[str, Any]:
         """Analyze Python-specific code patterns."""
         analysis = {
@@ -504,7 +541,7 @@ class CodeAnalyzer:
         # Detect recursion
         if 'def ' in code and code.count('def ') > 1:
             # Check if function calls itself
-            func_names = re.findall(r'def (\w+)', code)
+            func_names = _DEF_NAME_RE.findall(code)
             for func_name in func_names:
                 if func_name in code.split('def ' + func_name)[1:]:
                     analysis['algorithm_type'] = 'recursive'
@@ -661,14 +698,14 @@ class CodeAnalyzer:
         patterns = []
         
         # Loop patterns
-        loop_count = len(re.findall(r'\b(for|while)\b', code, re.IGNORECASE))
+        loop_count = len(_LOOP_RE.findall(code))
         if loop_count > 1:
             patterns.append('Nested Iteration')
         elif loop_count == 1:
             patterns.append('Single Loop')
         
         # Conditional patterns
-        if_count = len(re.findall(r'\bif\b', code, re.IGNORECASE))
+        if_count = len(_IF_RE.findall(code))
         if if_count > 3:
             patterns.append('Complex Conditional Logic')
         
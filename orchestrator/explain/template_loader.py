@@ -6,6 +6,7 @@ This module handles loading and managing explanation templates with
 pattern-based template selection and variable substitution.
 """
 
+import functools
 import os
 import re
 import json
@@ -192,18 +193,16 @@ class TemplateLoader:
         for template_name, template_data in default_templates.items():
             template_file = self.templates_dir / f"{template_name}.md"
             
-            # Create front matter
+            # Create front matter, one key per line between the delimiters
             metadata = template_data['metadata']
-            front_matter = "---"
+            front_matter_lines = ["---"]
             for key, value in metadata.items():
-                if isinstance(value, list):
-                    front_matter += f"{key}: {value}"
-                else:
-                    front_matter += f"{key}: {value}"
-            front_matter += "---"
-            
+                front_matter_lines.append(f"{key}: {value}")
+            front_matter_lines.append("---")
+            front_matter = '\n'.join(front_matter_lines)
+
             # Write template file
-            full_content = front_matter + template_data['content']
+            full_content = front_matter + '\n\n' + template_data['content']
             template_file.write_text(full_content, encoding='utf-8')
             
             logger.info(f"Created default template: {template_name}")
@@ -274,14 +273,29 @@ class TemplateLoader:
             logger.error(f"Template not found: {template_name}")
             return f"Template '{template_name}' not found."
         
-        template_data = self.templates_cache[template_name]
-        content = template_data['content']
-        
-        # Simple variable substitution
-        for var_name, var_value in variables.items():
+        try:
+            return self._render_cached(template_name, tuple(sorted(variables.items())))
+        except TypeError:
+            # Unhashable variable values cannot be cached - render directly
+            return self._substitute(
+                self.templates_cache[template_name]['content'], variables.items())
+
+    @functools.lru_cache(maxsize=256)
+    def _render_cached(self, template_name: str, variable_items: tuple) -> str:
+        """Render and memoize; keyed by template name and variable items.
+
+        The same problem is re-explained with identical variables many
+        times in a session, so repeated renders become a dict lookup.
+        """
+        return self._substitute(
+            self.templates_cache[template_name]['content'], variable_items)
+
+    @staticmethod
+    def _substitute(content: str, variable_items) -> str:
+        """Apply {{name}} variable substitution to template content."""
+        for var_name, var_value in variable_items:
             placeholder = f"{{{{{var_name}}}}}"
             content = content.replace(placeholder, str(var_value))
-        
         return content
     
     def get_template_metadata(self, template_name: str) -> Dict[str, Any]:
@@ -306,5 +320,6 @@ class TemplateLoader:
         """Reload all templates from disk."""
         self.templates_cache.clear()
         self.pattern_cache.clear()
+        self._render_cached.cache_clear()
         self._load_templates()
         logger.info("Templates reloaded")
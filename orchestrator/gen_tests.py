@@ -17,6 +17,26 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    _orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes with orjson when available."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_indented(obj):
+    """Serialize obj to indented UTF-8 bytes with orjson when available."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 # Add the orchestrator directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -137,8 +157,7 @@ class TestGenerator:
             raise TestGenerationError(f"problem.json not found in {self.problem_dir}")
         
         try:
-            with open(problem_file, 'r', encoding='utf-8') as f:
-                problem = json.load(f)
+            problem = _json_loads(problem_file.read_bytes())
             
             # Validate problem structure
             if 'slug' not in problem:
@@ -474,11 +493,40 @@ class TestGenerator:
         """Write generation metadata to file."""
         metadata_file = self.output_dir / "generation_metadata.json"
         
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        metadata_file.write_bytes(_json_dumps_indented(metadata))
         
         logger.debug(f"Wrote metadata: {metadata_file}")
 
+def run_server():
+    """Serve generation requests as JSON lines over stdin/stdout.
+
+    Each request is one JSON object per line carrying problem_dir and
+    the optional generator arguments; each response is one JSON line.
+    A single long-lived process amortizes interpreter and import
+    startup across many generation calls.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = _json_loads(line)
+            output_dir = request.get("output_dir")
+            test_gen = TestGenerator(
+                Path(request["problem_dir"]),
+                Path(output_dir) if output_dir else None
+            )
+            response = test_gen.generate_tests(
+                generator_type=request.get("type", "auto"),
+                num_cases=request.get("num_cases"),
+                seed=request.get("seed", 42),
+                force=request.get("force", False)
+            )
+        except Exception as e:
+            response = {"status": "error", "error": str(e)}
+        print(json.dumps(response), flush=True)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -497,6 +545,7 @@ Examples:
     parser.add_argument(
         'problem_dir',
         type=Path,
+        nargs='?',
         help='Directory containing problem.json'
     )
     
@@ -548,8 +597,22 @@ Examples:
         help='Suppress all output except errors'
     )
     
+    parser.add_argument(
+        '--server',
+        action='store_true',
+        help='Read JSON generation requests from stdin, one per line'
+    )
+    
     args = parser.parse_args()
     
+    if args.server:
+        logging.getLogger().setLevel(logging.ERROR)
+        run_server()
+        return
+    
+    if args.problem_dir is None:
+        parser.error('problem_dir is required unless --server is given')
+    
     # Configure logging level
     if args.quiet:
         logging.getLogger().setLevel(logging.ERROR)
@@ -3,6 +3,7 @@ Performance monitoring integration for the execution system.
 This module integrates performance monitoring into the existing
 code execution and testing infrastructure.
 """
+import functools
 import time
 import logging
 from typing import Dict, Any, Optional
@@ -197,6 +198,7 @@ execution_monitor = ExecutionMonitor()
 def monitor_compilation(language: str, code_size: int):
     """Decorator to monitor compilation performance."""
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             return execution_monitor.monitor_compilation(language, code_size, lambda: func(*args, **kwargs))
         return wrapper
@@ -205,6 +207,7 @@ def monitor_compilation(language: str, code_size: int):
 def monitor_execution(language: str, test_count: int):
     """Decorator to monitor execution performance."""
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             return execution_monitor.monitor_execution(language, test_count, lambda: func(*args, **kwargs))
         return wrapper
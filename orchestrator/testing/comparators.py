@@ -10,10 +10,21 @@ import re
 import json
 import math
 from abc import ABC, abstractmethod
+from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass
 
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    _json_loads = json.loads
+
 class ComparisonResult(Enum):
     """Result of output comparison."""
     MATCH = "MATCH"
@@ -45,7 +56,9 @@ class OutputComparator(ABC):
 
 class TextExactComparator(OutputComparator):
     """Exact text comparison with whitespace normalization."""
-    
+
+    _WS_RE = re.compile(r'\s+')
+
     def __init__(self, 
                  normalize_whitespace: bool = True,
                  ignore_trailing_whitespace: bool = True,
@@ -57,6 +70,15 @@ class TextExactComparator(OutputComparator):
     def compare(self, expected: str, actual: str) -> ComparisonDetails:
         """Compare text with optional normalization."""
         try:
+            # Identical inputs match under every normalization setting -
+            # skip normalization and similarity scoring entirely
+            if expected == actual:
+                return ComparisonDetails(
+                    result=ComparisonResult.MATCH,
+                    message="Output matches exactly",
+                    similarity_score=1.0
+                )
+
             # Normalize inputs
             exp_normalized = self._normalize_text(expected)
             act_normalized = self._normalize_text(actual)
@@ -94,7 +116,7 @@ class TextExactComparator(OutputComparator):
         
         if self.normalize_whitespace:
             # Normalize multiple whitespace to single space
-            text = re.sub(r'\s+', ' ', text.strip())
+            text = self._WS_RE.sub(' ', text.strip())
         
         return text
     
@@ -154,8 +176,15 @@ class TextExactComparator(OutputComparator):
         if not text1 or not text2:
             return 0.0
         
-        # Simple Levenshtein-based similarity
         max_len = max(len(text1), len(text2))
+
+        # Levenshtein is O(n*m); for large outputs a positional match
+        # ratio is a good-enough score at a fraction of the cost
+        if max_len > 1000:
+            matching = sum(a == b for a, b in zip(text1, text2))
+            return matching / max_len
+
+        # Simple Levenshtein-based similarity
         distance = self._levenshtein_distance(text1, text2)
         return max(0.0, 1.0 - distance / max_len)
     
@@ -207,21 +236,32 @@ class NumericComparator(OutputComparator):
                     actual_parsed=act_numbers
                 )
             
+            if _np is not None and exp_numbers:
+                mismatch_indices = self._mismatch_indices_vectorized(
+                    exp_numbers, act_numbers)
+            else:
+                mismatch_indices = [
+                    i for i, (exp_val, act_val)
+                    in enumerate(zip(exp_numbers, act_numbers))
+                    if not self._numbers_equal(exp_val, act_val)
+                ]
+
             mismatches = []
             total_error = 0.0
-            
-            for i, (exp_val, act_val) in enumerate(zip(exp_numbers, act_numbers)):
-                if not self._numbers_equal(exp_val, act_val):
-                    error = abs(exp_val - act_val)
-                    relative_error = error / max(abs(exp_val), abs(act_val), 1e-10)
-                    mismatches.append({
-                        'index': i,
-                        'expected': exp_val,
-                        'actual': act_val,
-                        'absolute_error': error,
-                        'relative_error': relative_error
-                    })
-                    total_error += error
+
+            for i in mismatch_indices:
+                exp_val = exp_numbers[i]
+                act_val = act_numbers[i]
+                error = abs(exp_val - act_val)
+                relative_error = error / max(abs(exp_val), abs(act_val), 1e-10)
+                mismatches.append({
+                    'index': i,
+                    'expected': exp_val,
+                    'actual': act_val,
+                    'absolute_error': error,
+                    'relative_error': relative_error
+                })
+                total_error += error
             
             if not mismatches:
                 return ComparisonDetails(
@@ -281,7 +321,28 @@ class NumericComparator(OutputComparator):
             return True
         
         return False
-    
+
+    def _mismatch_indices_vectorized(self, exp_numbers: List[float],
+                                     act_numbers: List[float]) -> List[int]:
+        """Find indices of out-of-tolerance values using NumPy.
+
+        Applies the same tolerance rules as _numbers_equal but as
+        vectorized array operations, so large numeric outputs avoid a
+        per-value Python loop.
+        """
+        a = _np.asarray(exp_numbers, dtype=float)
+        b = _np.asarray(act_numbers, dtype=float)
+
+        with _np.errstate(invalid='ignore', divide='ignore'):
+            abs_diff = _np.abs(a - b)
+            max_val = _np.maximum(_np.abs(a), _np.abs(b))
+            equal = (abs_diff <= self.epsilon) | (
+                (max_val > 0) & (abs_diff / max_val <= self.relative_tolerance))
+        # Exact equality covers matching infinities; NaN only matches NaN
+        equal |= (a == b) | (_np.isnan(a) & _np.isnan(b))
+
+        return _np.nonzero(~equal)[0].tolist()
+
     def _format_numeric_diff(self, mismatches: List[Dict]) -> str:
         """Format numeric differences for display."""
         lines = []
@@ -311,8 +372,8 @@ class JsonComparator(OutputComparator):
     def compare(self, expected: str, actual: str) -> ComparisonDetails:
         """Compare JSON structures."""
         try:
-            exp_json = json.loads(expected.strip())
-            act_json = json.loads(actual.strip())
+            exp_json = _json_loads(expected.strip())
+            act_json = _json_loads(actual.strip())
             
             differences = []
             self._compare_json_recursive(exp_json, act_json, "", differences)
@@ -338,7 +399,7 @@ class JsonComparator(OutputComparator):
                     similarity_score=similarity
                 )
                 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             return ComparisonDetails(
                 result=ComparisonResult.ERROR,
                 message=f"JSON parsing error: {str(e)}"
@@ -399,6 +460,16 @@ class JsonComparator(OutputComparator):
     
     def _compare_lists_unordered(self, expected: list, actual: list, path: str, differences: List[str]):
         """Compare lists ignoring order."""
+        # Fast path: multiset equality for hashable elements avoids the
+        # O(n log n) canonical sort. Only a positive result is
+        # conclusive - exact inequality may still match within the
+        # numeric tolerance below.
+        try:
+            if Counter(expected) == Counter(actual):
+                return
+        except TypeError:
+            pass
+
         # This is a simplified approach - for complex cases, we'd need better matching
         exp_sorted = sorted(expected, key=lambda x: json.dumps(x, sort_keys=True))
         act_sorted = sorted(actual, key=lambda x: json.dumps(x, sort_keys=True))
@@ -520,6 +591,22 @@ class ArrayComparator(OutputComparator):
     def get_name(self) -> str:
         return "Array"
 
+# Numeric-only outputs: one or more numbers separated by spaces/commas
+_NUMERIC_LINE_RE = re.compile(
+    r'^[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+    r'(?:\s*,?\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)*$')
+
+# Shared default instances handed out by auto-detection; the comparators
+# hold only configuration, so reuse is safe and skips an allocation per
+# detected pair.
+_AUTO_TEXT = TextExactComparator()
+_AUTO_NUMERIC = NumericComparator()
+_AUTO_JSON = JsonComparator()
+_AUTO_ARRAY = ArrayComparator()
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
 class ComparatorFactory:
     """Factory for creating appropriate comparators based on problem type."""
     
@@ -542,39 +629,47 @@ class ComparatorFactory:
     
     @staticmethod
     def auto_detect_comparator(expected: str, actual: str) -> OutputComparator:
-        """Auto-detect the best comparator for the given outputs."""
+        """Auto-detect the best comparator for the given outputs.
+
+        Dispatches on the first character of the expected output instead
+        of running every format check in sequence, and returns shared
+        comparator instances.
+        """
         exp_stripped = expected.strip()
         act_stripped = actual.strip()
-        
-        # Check if it's primarily numeric first (before JSON, since numbers are valid JSON)
-        numeric_pattern = r'^[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?:\s*,?\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)*$'
-        if re.match(numeric_pattern, exp_stripped) and re.match(numeric_pattern, act_stripped):
-            return NumericComparator()
-        
-        # Check if it looks like an array (before JSON, since arrays are valid JSON)
-        if ((exp_stripped.startswith('[') and exp_stripped.endswith(']')) or \
-           (exp_stripped.startswith('(') and exp_stripped.endswith(')'))) and \
-           ((act_stripped.startswith('[') and act_stripped.endswith(']')) or \
-           (act_stripped.startswith('(') and act_stripped.endswith(')'))):
-            # Check if it's a simple array (not complex JSON)
+
+        first = exp_stripped[:1]
+        if first in ('[', '('):
+            # Both sides bracketed: a flat list of primitives is an
+            # array; deeper structures fall through to JSON
+            if (act_stripped[:1] in ('[', '(')
+                    and exp_stripped[-1:] in (']', ')')
+                    and act_stripped[-1:] in (']', ')')):
+                try:
+                    exp_parsed = json.loads(exp_stripped)
+                    act_parsed = json.loads(act_stripped)
+                except ValueError:
+                    # Not valid JSON, still try array comparison
+                    return _AUTO_ARRAY
+                if (isinstance(exp_parsed, list) and isinstance(act_parsed, list)
+                        and all(isinstance(x, _PRIMITIVES) for x in exp_parsed)):
+                    return _AUTO_ARRAY
+                return _AUTO_JSON
+        elif first == '{':
             try:
-                exp_parsed = json.loads(exp_stripped)
-                act_parsed = json.loads(act_stripped)
-                # If it's a simple list of primitives, use ArrayComparator
-                if isinstance(exp_parsed, list) and isinstance(act_parsed, list):
-                    if all(isinstance(x, (str, int, float, bool, type(None))) for x in exp_parsed):
-                        return ArrayComparator()
-            except:
-                # If JSON parsing fails, still try array comparator
-                return ArrayComparator()
-        
-        # Try JSON for complex structures
+                json.loads(exp_stripped)
+                json.loads(act_stripped)
+                return _AUTO_JSON
+            except ValueError:
+                return _AUTO_TEXT
+        elif _NUMERIC_LINE_RE.match(exp_stripped) and _NUMERIC_LINE_RE.match(act_stripped):
+            return _AUTO_NUMERIC
+
+        # Remaining cases: mismatched bracketing, bare JSON scalars, or
+        # plain text
         try:
             json.loads(exp_stripped)
             json.loads(act_stripped)
-            return JsonComparator()
-        except:
-            pass
-        
-        # Default to text comparison
-        return TextExactComparator()
\ No newline at end of file
+            return _AUTO_JSON
+        except ValueError:
+            return _AUTO_TEXT
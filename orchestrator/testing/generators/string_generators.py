@@ -10,6 +10,11 @@ from typing import List, Set, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    _np = None
+
 from .base import TestGenerator, GeneratorConfig, TestCase, TestCaseType
 from .constraints import (
     LengthConstraint, CharsetConstraint, PatternConstraint, 
@@ -81,7 +86,17 @@ class StringTestGenerator(TestGenerator):
         )
         
         super().__init__(config)
-    
+
+        # One seeded NumPy stream and charset byte array per generator;
+        # bulk fills draw from these instead of building a fresh
+        # generator and alphabet array on every call
+        if _np is not None and self._charset.isascii():
+            self._np_rng = _np.random.default_rng(config.seed)
+            self._alphabet = _np.frombuffer(self._charset.encode(), dtype=_np.uint8)
+        else:
+            self._np_rng = None
+            self._alphabet = None
+
     def _get_charset(self) -> str:
         """Get the character set for generation."""
         charset_name = self.string_config.charset
@@ -179,6 +194,12 @@ class StringTestGenerator(TestGenerator):
     
     def _generate_random_string(self, length: int) -> str:
         """Generate a random string of specified length."""
+        # Long strings are filled from one NumPy draw over the charset
+        # bytes instead of a per-character Python loop; short strings
+        # keep the scalar path where array setup dominates
+        if self._np_rng is not None and length >= 64:
+            return self._np_rng.choice(self._alphabet, size=length).tobytes().decode()
+
         return ''.join(self.generate_random_choice(self._charset) for _ in range(length))
     
     def _generate_palindrome(self, length: int) -> str:
@@ -216,12 +237,10 @@ class StringTestGenerator(TestGenerator):
         # Choose two characters to alternate
         char1 = self.generate_random_choice(self._charset)
         char2 = self.generate_random_choice(self._charset)
-        
-        result = []
-        for i in range(length):
-            result.append(char1 if i % 2 == 0 else char2)
-        
-        return ''.join(result)
+
+        # Repeat the two-character unit and slice to length instead of
+        # appending character by character
+        return ((char1 + char2) * (length // 2 + 1))[:length]
     
     def _generate_ascending_string(self, length: int) -> str:
         """Generate a string with characters in ascending order."""
@@ -334,33 +353,66 @@ class CoverAllCharsGenerator(StringTestGenerator):
     def __init__(self, config: StringGeneratorConfig):
         """Initialize cover all chars generator."""
         super().__init__(config)
+        # ASCII charsets track coverage as one bit per character code in
+        # a single int; wider charsets fall back to a character set
+        self._ascii_coverage = self._charset.isascii()
+        self._charset_mask = self._char_mask(self._charset) if self._ascii_coverage else 0
+        self._seen_mask = 0
         self._coverage_tracker = set()
-    
+
+    @staticmethod
+    def _char_mask(text: str) -> int:
+        """Build a bitmask with one bit set per ASCII code in text."""
+        mask = 0
+        for byte in text.encode():
+            mask |= 1 << byte
+        return mask
+
+    @staticmethod
+    def _chars_from_mask(mask: int) -> Set[str]:
+        """Decode a character bitmask back into a set of characters."""
+        chars = set()
+        while mask:
+            bit = mask.bit_length() - 1
+            chars.add(chr(bit))
+            mask ^= 1 << bit
+        return chars
+
     def generate_test_cases(self) -> List[TestCase]:
         """Generate test cases ensuring character coverage."""
-        # Reset coverage tracker
+        # Reset coverage tracking
+        self._seen_mask = 0
         self._coverage_tracker = set()
-        
+
         # Generate normal test cases
         test_cases = super().generate_test_cases()
-        
+
         # Check coverage and add cases if needed
-        missing_chars = set(self._charset) - self._coverage_tracker
-        
+        missing_chars = self._missing_chars()
+
         if missing_chars and self.string_config.ensure_coverage:
             # Generate additional cases to cover missing characters
             coverage_cases = self._generate_coverage_cases(missing_chars)
             test_cases.extend(coverage_cases)
-        
+
         return test_cases
-    
+
+    def _missing_chars(self) -> Set[str]:
+        """Get the charset characters not yet seen in generated cases."""
+        if self._ascii_coverage:
+            return self._chars_from_mask(self._charset_mask & ~self._seen_mask)
+        return set(self._charset) - self._coverage_tracker
+
     def _generate_single_case(self, case_type: TestCaseType, case_index: int) -> TestCase:
         """Generate a single case and track character coverage."""
         test_case = super()._generate_single_case(case_type, case_index)
-        
+
         # Track characters used
-        self._coverage_tracker.update(test_case.input_data)
-        
+        if self._ascii_coverage:
+            self._seen_mask |= self._char_mask(test_case.input_data)
+        else:
+            self._coverage_tracker.update(test_case.input_data)
+
         return test_case
     
     def _generate_coverage_cases(self, missing_chars: Set[str]) -> List[TestCase]:
@@ -406,15 +458,19 @@ class CoverAllCharsGenerator(StringTestGenerator):
     def get_coverage_report(self) -> Dict[str, Any]:
         """Get character coverage report."""
         total_chars = len(self._charset)
-        covered_chars = len(self._coverage_tracker)
-        missing_chars = set(self._charset) - self._coverage_tracker
-        
+        if self._ascii_coverage:
+            covered = self._chars_from_mask(self._seen_mask)
+        else:
+            covered = self._coverage_tracker
+        covered_chars = len(covered)
+        missing_chars = self._missing_chars()
+
         return {
             'total_characters': total_chars,
             'covered_characters': covered_chars,
             'coverage_percentage': (covered_chars / total_chars) * 100 if total_chars > 0 else 0,
             'missing_characters': sorted(missing_chars),
-            'covered_characters_list': sorted(self._coverage_tracker)
+            'covered_characters_list': sorted(covered)
         }
 
 class ReverseStringGenerator(StringTestGenerator):
@@ -422,6 +478,8 @@ class ReverseStringGenerator(StringTestGenerator):
     
     def _compute_expected_output(self, input_string: str) -> str:
         """Reverse the input string."""
+        # str slicing reverses in one C-level copy; routing through a
+        # byte buffer only adds an encode/decode round-trip
         return input_string[::-1]
 
 class UppercaseGenerator(StringTestGenerator):
@@ -429,6 +487,8 @@ class UppercaseGenerator(StringTestGenerator):
     
     def _compute_expected_output(self, input_string: str) -> str:
         """Convert input string to uppercase."""
+        # str.upper is a single C pass; a bitwise b & 0xDF over a NumPy
+        # buffer loses to it once the encode/decode round-trip is paid
         return input_string.upper()
 
 class LowercaseGenerator(StringTestGenerator):
@@ -254,23 +254,28 @@ Step 1: Do this
         
         # Load explanation (should cache it)
         explanation1 = self.loader.load_community_explanation("cached-problem")
-        
-        # Modify file on disk
-        explanation_file.write_text("# Modified Explanation\\n\\nThis is modified.", encoding='utf-8')
-        
-        # Load again (should return cached version)
+
+        # Load again without touching the file (should be a cache hit)
         explanation2 = self.loader.load_community_explanation("cached-problem")
-        assert explanation1['content'] == explanation2['content']
-        assert "Modified" not in explanation2['content']
-        
-        # Reload bypassing cache
-        explanation3 = self.loader.reload_explanation("cached-problem")
+        assert explanation2 is explanation1
+
+        # Modify file on disk; the mtime change invalidates the cache
+        import os
+        explanation_file.write_text("# Modified Explanation\\n\\nThis is modified.", encoding='utf-8')
+        stat = explanation_file.stat()
+        os.utime(explanation_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        explanation3 = self.loader.load_community_explanation("cached-problem")
         assert "Modified" in explanation3['content']
-        
+
+        # Reload bypassing cache
+        explanation4 = self.loader.reload_explanation("cached-problem")
+        assert "Modified" in explanation4['content']
+
         # Clear cache and load
         self.loader.clear_cache()
-        explanation4 = self.loader.load_community_explanation("cached-problem")
-        assert "Modified" in explanation4['content']
+        explanation5 = self.loader.load_community_explanation("cached-problem")
+        assert "Modified" in explanation5['content']
 
 class TestExplanationEngineIntegration:
     """Test integration of community explanations with ExplanationEngine."""